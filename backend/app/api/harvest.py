@@ -48,20 +48,22 @@ async def trigger_harvest(payload: TriggerRequest, db: DbSession) -> dict:
     from app.worker import has_celery_workers
 
     if has_celery_workers():
-        from app.worker import trigger_harvest_task
+        from app.worker import harvest_and_enrich
 
-        task = trigger_harvest_task.delay(payload.profile_id, payload.source)
+        # apply_async returns the chain's last task; report the harvest step
+        task = harvest_and_enrich(payload.profile_id, payload.source).apply_async()
+        harvest_task_id = task.parent.id
         log_event(
             db,
             event_type="harvest.triggered",
             entity_type="profile",
             entity_id=payload.profile_id,
-            metadata={"source": payload.source, "task_id": task.id},
+            metadata={"source": payload.source, "task_id": harvest_task_id},
         )
         await db.commit()
         return {
             "status": "queued",
-            "task_id": task.id,
+            "task_id": harvest_task_id,
             "profile_id": payload.profile_id,
             "source": payload.source,
         }
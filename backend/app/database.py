@@ -1,11 +1,25 @@
 from collections.abc import AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def json_serializer(value: object) -> str:
+    """Serialize JSON/JSONB column values with orjson instead of stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+json_deserializer = orjson.loads
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+)
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
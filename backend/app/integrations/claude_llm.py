@@ -2,6 +2,7 @@ import asyncio
 import hashlib
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import anthropic
 
@@ -21,6 +22,34 @@ class ExtractionResult:
     error: str | None = None
 
 
+@lru_cache(maxsize=32)
+def _extraction_tool(schema_items: tuple[tuple[str, str], ...]) -> dict:
+    properties: dict = {}
+    for field_name, description in schema_items:
+        properties[field_name] = {
+            "description": description,
+            "anyOf": [
+                {"type": "string"},
+                {"type": "array", "items": {"type": "string"}},
+                {"type": "null"},
+            ],
+        }
+
+    return {
+        "name": "extract_vacancy_data",
+        "description": (
+            "Extract structured data from a job vacancy text. "
+            "Return null for any field where the information "
+            "is not present in the text."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": properties,
+            "required": [field_name for field_name, _ in schema_items],
+        },
+    }
+
+
 class ClaudeLLMClient:
     """Low-level client wrapping the Anthropic SDK for structured extraction."""
 
@@ -32,32 +61,14 @@ class ClaudeLLMClient:
         """Build a tool definition from an extraction schema.
 
         The extraction_schema maps field names to description strings.
-        Each field becomes a property in the tool's input_schema.
+        Each field becomes a property in the tool's input_schema. Definitions
+        are cached per schema, so the returned dict must not be mutated.
         """
-        properties: dict = {}
-        for field_name, description in extraction_schema.items():
-            properties[field_name] = {
-                "description": description,
-                "anyOf": [
-                    {"type": "string"},
-                    {"type": "array", "items": {"type": "string"}},
-                    {"type": "null"},
-                ],
-            }
-
-        return {
-            "name": "extract_vacancy_data",
-            "description": (
-                "Extract structured data from a job vacancy text. "
-                "Return null for any field where the information "
-                "is not present in the text."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": properties,
-                "required": list(extraction_schema.keys()),
-            },
-        }
+        schema_items = tuple(extraction_schema.items())
+        try:
+            return _extraction_tool(schema_items)
+        except TypeError:  # unhashable descriptions
+            return _extraction_tool.__wrapped__(schema_items)
 
     async def extract_vacancy_data(
         self,
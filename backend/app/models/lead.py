@@ -46,6 +46,12 @@ class Lead(Base):
         ),
         Index("ix_lead_status", "status"),
         Index("ix_lead_composite_score", "composite_score"),
+        Index(
+            "ix_lead_hot_warm_score",
+            composite_score.desc(),
+            postgresql_include=["company_id", "search_profile_id"],
+            postgresql_where=status.in_(["hot", "warm"]),
+        ),
     )
 
 
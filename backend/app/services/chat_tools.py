@@ -455,14 +455,15 @@ async def _handle_get_lead_stats(tool_input: dict, db: AsyncSession) -> dict:
 
 
 async def _handle_trigger_harvest(tool_input: dict, db: AsyncSession) -> dict:
-    from app.worker import trigger_harvest_task
+    from app.worker import harvest_and_enrich
 
     profile_id = tool_input["profile_id"]
     source = tool_input.get("source", "google_jobs")
-    task = trigger_harvest_task.delay(profile_id, source)
+    # apply_async returns the chain's last task; report the harvest step
+    task = harvest_and_enrich(profile_id, source).apply_async()
     return {
         "status": "queued",
-        "task_id": task.id,
+        "task_id": task.parent.id,
         "profile_id": profile_id,
         "source": source,
     }
@@ -1,8 +1,9 @@
 import logging
 import re
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.company import Company
 
@@ -17,6 +18,8 @@ _LEGAL_SUFFIXES = re.compile(
 # Characters to normalize
 _NOISE_CHARS = re.compile(r"[&\-.,/\\|()\"']")
 
+_WHITESPACE = re.compile(r"\s+")
+
 
 def normalize_company_name(name: str) -> str:
     """Normalize a company name for deduplication matching."""
@@ -31,26 +34,48 @@ def normalize_company_name(name: str) -> str:
     # Replace noise characters with space
     name = _NOISE_CHARS.sub(" ", name)
     # Collapse whitespace
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _WHITESPACE.sub(" ", name).strip()
 
     return name
 
 
+# Session.info key for the normalized name -> company id map kept by
+# find_or_create_company
+_COMPANY_IDS_KEY = "dedup_company_ids"
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_company_ids(session: Session, previous_transaction) -> None:
+    session.info.pop(_COMPANY_IDS_KEY, None)
+
+
 async def find_or_create_company(db: AsyncSession, raw_company_name: str) -> Company:
-    """Find an existing company by normalized name, or create a new one."""
+    """Find an existing company by normalized name, or create a new one.
+
+    Companies already resolved in this session are looked up by id, which the
+    identity map serves without a query. A harvest batch names the same
+    company many times.
+    """
     normalized = normalize_company_name(raw_company_name)
+    company_ids: dict[str, int] = db.info.setdefault(_COMPANY_IDS_KEY, {})
+
+    company_id = company_ids.get(normalized)
+    if company_id is not None:
+        company = await db.get(Company, company_id)
+        if company:
+            return company
 
     result = await db.execute(
         select(Company).where(Company.normalized_name == normalized)
     )
     company = result.scalar_one_or_none()
 
-    if company:
-        return company
+    if not company:
+        company = Company(name=raw_company_name, normalized_name=normalized)
+        db.add(company)
+        await db.flush()
 
-    company = Company(name=raw_company_name, normalized_name=normalized)
-    db.add(company)
-    await db.flush()
+    company_ids[normalized] = company.id
     return company
 
 
@@ -72,38 +72,35 @@ class EnrichmentOrchestrator:
         if not prompt:
             return
 
-        # Load ALL relevant vacancies in one query, group by company_id in memory
+        # Load only the columns the score needs (not raw_text) for ALL relevant
+        # vacancies in one query, and score them grouped by company_id
         result = await self.db.execute(
-            select(Vacancy).where(
+            select(Vacancy.company_id, Vacancy.extracted_data).where(
                 Vacancy.search_profile_id == profile_id,
                 Vacancy.extraction_status == "completed",
                 Vacancy.company_id.isnot(None),
                 Vacancy.extracted_data.isnot(None),
             )
         )
-        all_vacancies = list(result.scalars().all())
-
-        vacancies_by_company: dict[int, list[Vacancy]] = defaultdict(list)
-        for v in all_vacancies:
-            vacancies_by_company[v.company_id].append(v)
+        qualities_by_company: dict[int, list[float]] = defaultdict(list)
+        for company_id, extracted_data in result.all():
+            qualities_by_company[company_id].append(
+                compute_extraction_quality(extracted_data, prompt.extraction_schema)
+            )
 
-        if not vacancies_by_company:
+        if not qualities_by_company:
             return
 
         # Load ALL relevant companies in one query
-        company_ids = list(vacancies_by_company.keys())
+        company_ids = list(qualities_by_company.keys())
         result = await self.db.execute(
             select(Company).where(Company.id.in_(company_ids))
         )
         companies_by_id = {c.id: c for c in result.scalars().all()}
 
-        # Compute scores in memory and update
-        for company_id, vacancies in vacancies_by_company.items():
-            total_quality = sum(
-                compute_extraction_quality(v.extracted_data, prompt.extraction_schema)
-                for v in vacancies
-            )
-            avg_quality = total_quality / len(vacancies)
+        # Average per company and update
+        for company_id, qualities in qualities_by_company.items():
+            avg_quality = sum(qualities) / len(qualities)
 
             company = companies_by_id.get(company_id)
             if company:
@@ -46,9 +46,12 @@ class HarvestService:
         try:
             all_results = await self._search_source(profile, source)
 
+            # One timestamp for the whole batch: it is both last_seen_at for
+            # known vacancies and the reference for relative posting dates.
+            seen_at = datetime.now(UTC)
             new_count = 0
             for item in all_results:
-                was_new = await self._store_vacancy(item, profile_id, run.id)
+                was_new = await self._store_vacancy(item, profile_id, run.id, seen_at)
                 if was_new:
                     new_count += 1
 
@@ -111,6 +114,7 @@ class HarvestService:
         item: SerpApiResult | IndeedResult,
         profile_id: int,
         run_id: int,
+        seen_at: datetime,
     ) -> bool:
         """Store a vacancy record, deduplicating by source + external_id.
 
@@ -125,14 +129,16 @@ class HarvestService:
             )
             existing = result.scalar_one_or_none()
             if existing:
-                existing.last_seen_at = datetime.now(UTC)
+                existing.last_seen_at = seen_at
                 return False
 
         company = await find_or_create_company(self.db, item.company_name)
 
         # Parse published_at from source's relative date string
         posted_at_raw = getattr(item, "posted_at", None)
-        published_at = parse_relative_date(posted_at_raw) if posted_at_raw else None
+        published_at = (
+            parse_relative_date(posted_at_raw, now=seen_at) if posted_at_raw else None
+        )
 
         vacancy = Vacancy(
             external_id=item.external_id,
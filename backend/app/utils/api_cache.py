@@ -12,11 +12,16 @@ Cache files are organized by source:
 """
 
 import hashlib
-import json
 import logging
+import os
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Default cache root relative to project root
@@ -24,15 +29,60 @@ _PROJECT_ROOT = Path(__file__).resolve().parents[3]  # backend/app/utils -> proj
 CACHE_DIR = _PROJECT_ROOT / "data" / "cache"
 
 
+def _params_digest(params: dict) -> str:
+    """Non-cryptographic 64-bit fingerprint of the request params."""
+    serialized = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(serialized, digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _params_digest_cached(params_key: tuple) -> str:
+    return _params_digest({key: value for key, _, value in params_key})
+
+
+# Source directories already created in this process
+_created_dirs: set[Path] = set()
+
+
 def _cache_key(source: str, params: dict) -> Path:
     """Generate a deterministic file path for a cache entry."""
-    serialized = json.dumps(params, sort_keys=True, ensure_ascii=False)
-    digest = hashlib.sha256(serialized.encode()).hexdigest()[:16]
+    try:
+        # The value type is part of the key so that e.g. 1 and 1.0 don't share
+        # a digest.
+        digest = _params_digest_cached(
+            tuple((key, type(value), value) for key, value in sorted(params.items()))
+        )
+    except TypeError:  # unhashable values (lists, nested dicts)
+        digest = _params_digest(params)
     source_dir = CACHE_DIR / source
-    source_dir.mkdir(parents=True, exist_ok=True)
+    if source_dir not in _created_dirs:
+        source_dir.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(source_dir)
     return source_dir / f"{digest}.json"
 
 
+# In-process LRU in front of the file cache, so repeated lookups in one run
+# skip the disk. Maps cache file path -> (cached_at epoch seconds, serialized
+# response). Keeping the orjson bytes rather than the dict means every hit
+# gets its own copy, matching what a read from disk would return.
+_MEMORY_CACHE_SIZE = 1024
+_memory_cache: OrderedDict[Path, tuple[float | None, bytes]] = OrderedDict()
+
+
+def _remember(path: Path, cached_at: float | None, response: bytes) -> None:
+    _memory_cache[path] = (cached_at, response)
+    _memory_cache.move_to_end(path)
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _is_expired(timestamp: float | None, max_age_days: int) -> bool:
+    if max_age_days <= 0 or timestamp is None:
+        return False
+    age_days = int((time.time() - timestamp) // 86400)
+    return age_days > max_age_days
+
+
 def cache_get(source: str, params: dict, max_age_days: int = 30) -> dict | None:
     """Read a cached API response if it exists and isn't too old.
 
@@ -46,26 +96,46 @@ def cache_get(source: str, params: dict, max_age_days: int = 30) -> dict | None:
         The cached response dict, or None if not found/expired.
     """
     path = _cache_key(source, params)
-    if not path.exists():
-        return None
+
+    entry = _memory_cache.get(path)
+    if entry is not None:
+        cached_at, response = entry
+        if _is_expired(cached_at, max_age_days):
+            logger.debug("Cache expired: %s (in memory)", path.name)
+            return None
+        _memory_cache.move_to_end(path)
+        logger.debug("Cache hit (memory): %s/%s", source, path.name)
+        return orjson.loads(response)
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        with path.open("rb") as f:
+            # A file is never modified before its entry was cached, so an old
+            # mtime means the entry is stale without having to parse it.
+            mtime = os.fstat(f.fileno()).st_mtime
+            if _is_expired(mtime, max_age_days):
+                logger.debug("Cache expired: %s (file mtime)", path.name)
+                return None
+            data = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (orjson.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to read cache %s: %s", path, exc)
         return None
 
-    # Check age
-    if max_age_days > 0:
-        cached_at = data.get("_cached_at")
-        if cached_at:
-            age = (datetime.now(UTC) - datetime.fromisoformat(cached_at)).days
-            if age > max_age_days:
-                logger.debug("Cache expired: %s (%d days old)", path.name, age)
-                return None
+    # Check age (mtime is reset by git checkouts, so _cached_at is authoritative)
+    cached_at_iso = data.get("_cached_at")
+    cached_at = (
+        datetime.fromisoformat(cached_at_iso).timestamp() if cached_at_iso else None
+    )
+    if _is_expired(cached_at, max_age_days):
+        logger.debug("Cache expired: %s", path.name)
+        return None
 
     logger.debug("Cache hit: %s/%s", source, path.name)
-    return data.get("response")
+    response = data.get("response")
+    if response is not None:
+        _remember(path, cached_at, orjson.dumps(response))
+    return response
 
 
 def cache_put(source: str, params: dict, response: dict) -> Path:
@@ -85,9 +155,7 @@ def cache_put(source: str, params: dict, response: dict) -> Path:
         "_params": params,
         "response": response,
     }
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    _remember(path, time.time(), orjson.dumps(response, default=str))
     logger.debug("Cache stored: %s/%s", source, path.name)
     return path
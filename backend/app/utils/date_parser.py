@@ -4,23 +4,42 @@ import re
 from datetime import UTC, datetime, timedelta
 
 # Patterns: "3 days ago", "2 weken geleden", "vandaag", "30+ days ago"
-_RELATIVE_PATTERNS: list[tuple[re.Pattern, str]] = [
+# A single pattern covers today/yesterday and every Dutch and English unit, so
+# a string is scanned once; the named group that matched tells them apart.
+_DATE_PATTERN = re.compile(
+    r"""
+    ^(?P<today>today|vandaag|just\ posted|net\ geplaatst|zojuist)$
+    |^(?P<yesterday>yesterday|gisteren)$
+    |(?P<value>\d+)\+?\s*
+     (?P<unit>dagen|dag|weken|week|maanden|maand|uur|uu|days?|weeks?|months?|hours?)
+     \s*(?:geleden|ago)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_DAY = timedelta(days=1)
+_WEEK = timedelta(weeks=1)
+_MONTH = timedelta(days=30)
+_HOUR = timedelta(hours=1)
+_UNIT_DELTAS: dict[str, timedelta] = {
     # Dutch
-    (re.compile(r"(\d+)\+?\s*dag(?:en)?\s*geleden", re.IGNORECASE), "days"),
-    (re.compile(r"(\d+)\+?\s*(?:week|weken)\s*geleden", re.IGNORECASE), "weeks"),
-    (re.compile(r"(\d+)\+?\s*(?:maand|maanden)\s*geleden", re.IGNORECASE), "months"),
-    (re.compile(r"(\d+)\+?\s*uur?\s*geleden", re.IGNORECASE), "hours"),
+    "dag": _DAY,
+    "dagen": _DAY,
+    "week": _WEEK,
+    "weken": _WEEK,
+    "maand": _MONTH,
+    "maanden": _MONTH,
+    "uu": _HOUR,
+    "uur": _HOUR,
     # English
-    (re.compile(r"(\d+)\+?\s*days?\s*ago", re.IGNORECASE), "days"),
-    (re.compile(r"(\d+)\+?\s*weeks?\s*ago", re.IGNORECASE), "weeks"),
-    (re.compile(r"(\d+)\+?\s*months?\s*ago", re.IGNORECASE), "months"),
-    (re.compile(r"(\d+)\+?\s*hours?\s*ago", re.IGNORECASE), "hours"),
-]
-
-_TODAY_PATTERNS = re.compile(
-    r"^(today|vandaag|just posted|net geplaatst|zojuist)$", re.IGNORECASE
-)
-_YESTERDAY_PATTERNS = re.compile(r"^(yesterday|gisteren)$", re.IGNORECASE)
+    "day": _DAY,
+    "days": _DAY,
+    "weeks": _WEEK,
+    "month": _MONTH,
+    "months": _MONTH,
+    "hour": _HOUR,
+    "hours": _HOUR,
+}
 
 
 def parse_relative_date(text: str, now: datetime | None = None) -> datetime | None:
@@ -38,24 +57,11 @@ def parse_relative_date(text: str, now: datetime | None = None) -> datetime | No
     if now is None:
         now = datetime.now(UTC)
 
-    if _TODAY_PATTERNS.match(text):
+    match = _DATE_PATTERN.search(text)
+    if match is None:
+        return None
+    if match.group("today"):
         return now
-
-    if _YESTERDAY_PATTERNS.match(text):
+    if match.group("yesterday"):
         return now - timedelta(days=1)
-
-    for pattern, unit in _RELATIVE_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            value = int(match.group(1))
-            if unit == "hours":
-                return now - timedelta(hours=value)
-            elif unit == "days":
-                return now - timedelta(days=value)
-            elif unit == "weeks":
-                return now - timedelta(weeks=value)
-            elif unit == "months":
-                return now - timedelta(days=value * 30)
-            break
-
-    return None
+    return now - int(match.group("value")) * _UNIT_DELTAS[match.group("unit").lower()]
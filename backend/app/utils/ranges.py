@@ -1,32 +1,19 @@
+from bisect import bisect_right
+
+# Lower bound of every bucket after the first; labels[i] covers
+# bounds[i - 1] <= value < bounds[i].
+_EMPLOYEE_BOUNDS = (10, 50, 100, 200, 500, 1000)
+_EMPLOYEE_LABELS = ("1-9", "10-49", "50-99", "100-199", "200-499", "500-999", "1000+")
+
+_REVENUE_BOUNDS = (1_000_000, 10_000_000, 50_000_000, 100_000_000, 500_000_000)
+_REVENUE_LABELS = ("<1M", "1M-10M", "10M-50M", "50M-100M", "100M-500M", "500M+")
+
+
 def employee_count_to_range(count: int) -> str:
     """Convert a numeric employee count to a range string."""
-    if count < 10:
-        return "1-9"
-    elif count < 50:
-        return "10-49"
-    elif count < 100:
-        return "50-99"
-    elif count < 200:
-        return "100-199"
-    elif count < 500:
-        return "200-499"
-    elif count < 1000:
-        return "500-999"
-    else:
-        return "1000+"
+    return _EMPLOYEE_LABELS[bisect_right(_EMPLOYEE_BOUNDS, count)]
 
 
 def revenue_to_range(revenue: int) -> str:
     """Convert a numeric revenue value to a range string."""
-    if revenue < 1_000_000:
-        return "<1M"
-    elif revenue < 10_000_000:
-        return "1M-10M"
-    elif revenue < 50_000_000:
-        return "10M-50M"
-    elif revenue < 100_000_000:
-        return "50M-100M"
-    elif revenue < 500_000_000:
-        return "100M-500M"
-    else:
-        return "500M+"
+    return _REVENUE_LABELS[bisect_right(_REVENUE_BOUNDS, revenue)]
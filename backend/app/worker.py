@@ -1,12 +1,26 @@
 import asyncio
 import logging
 import time
+from collections.abc import Coroutine
+from typing import Any
 
-from celery import Celery
+from celery import Celery, Signature, chain, group
 from celery.schedules import crontab
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from celery.signals import worker_process_init
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings
+from app.database import json_deserializer, json_serializer
+from app.models.profile import SearchProfile
+from app.services.enrichment import EnrichmentOrchestrator
+from app.services.harvester import HarvestService
+from app.services.scoring import ScoringService
 
 logger = logging.getLogger(__name__)
 
@@ -49,52 +63,148 @@ celery_app.conf.beat_schedule = {
     },
 }
 celery_app.conf.timezone = "Europe/Amsterdam"
+celery_app.conf.update(
+    # Harvest/enrichment tasks run for minutes; don't let one worker reserve
+    # a backlog while others sit idle.
+    worker_prefetch_multiplier=1,
+    # Re-deliver a task if the worker dies mid-run. Nothing claims work that is
+    # already in flight, so a redelivery repeats the run and its API calls;
+    # enrichment tasks opt out below because their Claude/KvK/Apollo calls are
+    # the expensive ones.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Redis redelivers an unacked task once the visibility timeout passes, even
+    # while a worker is still running it. Keep it well above the longest run
+    # (the default is 1 hour).
+    broker_transport_options={"visibility_timeout": 12 * 60 * 60},
+    broker_connection_retry_on_startup=True,
+    broker_pool_limit=10,
+)
+
+
+# One engine per worker process, created on first use so importing this module
+# (e.g. from the API to enqueue tasks) doesn't open a pool.
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def _get_async_session() -> async_sessionmaker[AsyncSession]:
-    engine = create_async_engine(settings.database_url)
-    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    global _engine, _session_factory
+    if _session_factory is None:
+        _engine = create_async_engine(
+            settings.database_url,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+        )
+        _session_factory = async_sessionmaker(
+            _engine, class_=AsyncSession, expire_on_commit=False
+        )
+    return _session_factory
+
+
+# Tasks share one event loop per worker process; asyncio.run would create and
+# close a loop per task, invalidating the loop-bound pooled connections.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def _run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a task coroutine on the worker's persistent event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs: Any) -> None:
+    """Create the event loop and DB engine up front in each worker process."""
+    _get_loop()
+    _get_async_session()
 
 
 @celery_app.task(name="app.worker.trigger_harvest")
-def trigger_harvest_task(profile_id: int, source: str = "google_jobs") -> None:
-    """Celery task to trigger a single harvest run."""
-    asyncio.run(_run_harvest(profile_id, source))
+def trigger_harvest_task(profile_id: int, source: str = "google_jobs") -> int:
+    """Celery task to trigger a single harvest run.
+
+    Returns the number of new vacancies, which ``harvest_and_enrich`` passes
+    on to the enrichment step.
+    """
+    return _run(_run_harvest(profile_id, source))
+
+
+@celery_app.task(name="app.worker.enrich_new_vacancies", acks_late=False)
+def enrich_new_vacancies_task(vacancies_new: int, profile_id: int) -> None:
+    """Celery task to enrich a profile after a harvest, if it found anything."""
+    if vacancies_new > 0:
+        logger.info(
+            "Auto-triggering enrichment for profile %d (%d new vacancies)",
+            profile_id,
+            vacancies_new,
+        )
+        _run(_run_enrichment(profile_id, "both"))
+
+
+def harvest_and_enrich(profile_id: int, source: str = "google_jobs") -> Signature:
+    """Build the harvest -> enrichment chain for a profile."""
+    return chain(
+        trigger_harvest_task.si(profile_id, source),
+        enrich_new_vacancies_task.s(profile_id),
+    )
 
 
 @celery_app.task(name="app.worker.harvest_all_profiles")
 def harvest_all_profiles() -> None:
-    """Celery task to harvest all active profiles."""
-    asyncio.run(_run_all_harvests())
+    """Celery task to fan out one harvest chain per profile across workers."""
+    profile_ids = _run(_fetch_profile_ids())
+    group(
+        harvest_and_enrich(profile_id, "google_jobs") for profile_id in profile_ids
+    ).apply_async()
 
 
-@celery_app.task(name="app.worker.trigger_enrichment")
+@celery_app.task(name="app.worker.trigger_enrichment", acks_late=False)
 def trigger_enrichment_task(profile_id: int, pass_type: str = "both") -> None:
     """Celery task to trigger enrichment for a profile."""
-    asyncio.run(_run_enrichment(profile_id, pass_type))
+    _run(_run_enrichment(profile_id, pass_type))
 
 
 @celery_app.task(name="app.worker.enrich_all_profiles")
 def enrich_all_profiles() -> None:
-    """Celery task to run enrichment for all profiles."""
-    asyncio.run(_run_all_enrichments())
+    """Celery task to fan out one enrichment task per profile across workers."""
+    profile_ids = _run(_fetch_profile_ids())
+    group(
+        trigger_enrichment_task.s(profile_id, "both") for profile_id in profile_ids
+    ).apply_async()
 
 
 @celery_app.task(name="app.worker.trigger_scoring")
 def trigger_scoring_task(profile_id: int) -> None:
     """Celery task to trigger scoring for a profile."""
-    asyncio.run(_run_scoring(profile_id))
+    _run(_run_scoring(profile_id))
 
 
 @celery_app.task(name="app.worker.score_all_profiles")
 def score_all_profiles() -> None:
     """Celery task to score all profiles."""
-    asyncio.run(_run_all_scoring())
+    _run(_run_all_scoring())
+
 
+async def _fetch_profile_ids() -> list[int]:
+    session_factory = _get_async_session()
+    async with session_factory() as db:
+        result = await db.execute(select(SearchProfile.id))
+        return list(result.scalars().all())
 
-async def _run_harvest(profile_id: int, source: str) -> None:
-    from app.services.harvester import HarvestService
 
+async def _run_harvest(profile_id: int, source: str) -> int:
     session_factory = _get_async_session()
     async with session_factory() as db:
         service = HarvestService(db=db)
@@ -105,36 +215,10 @@ async def _run_harvest(profile_id: int, source: str) -> None:
             run.vacancies_found,
             run.vacancies_new,
         )
-
-        # Auto-trigger enrichment if new vacancies were found
-        if run.status == "completed" and run.vacancies_new > 0:
-            logger.info(
-                "Auto-triggering enrichment for profile %d (%d new vacancies)",
-                profile_id,
-                run.vacancies_new,
-            )
-            trigger_enrichment_task.delay(profile_id, "both")
-
-
-async def _run_all_harvests() -> None:
-    from sqlalchemy import select
-
-    from app.models.profile import SearchProfile
-
-    session_factory = _get_async_session()
-    async with session_factory() as db:
-        result = await db.execute(select(SearchProfile))
-        profiles = result.scalars().all()
-        for profile in profiles:
-            try:
-                await _run_harvest(profile.id, "google_jobs")
-            except Exception as exc:
-                logger.error("Harvest failed for profile %d: %s", profile.id, exc)
+        return run.vacancies_new if run.status == "completed" else 0
 
 
 async def _run_enrichment(profile_id: int, pass_type: str) -> None:
-    from app.services.enrichment import EnrichmentOrchestrator
-
     session_factory = _get_async_session()
     async with session_factory() as db:
         orchestrator = EnrichmentOrchestrator(db=db)
@@ -154,25 +238,7 @@ async def _run_enrichment(profile_id: int, pass_type: str) -> None:
         trigger_scoring_task.delay(profile_id)
 
 
-async def _run_all_enrichments() -> None:
-    from sqlalchemy import select
-
-    from app.models.profile import SearchProfile
-
-    session_factory = _get_async_session()
-    async with session_factory() as db:
-        result = await db.execute(select(SearchProfile))
-        profiles = result.scalars().all()
-        for profile in profiles:
-            try:
-                await _run_enrichment(profile.id, "both")
-            except Exception as exc:
-                logger.error("Enrichment failed for profile %d: %s", profile.id, exc)
-
-
 async def _run_scoring(profile_id: int) -> None:
-    from app.services.scoring import ScoringService
-
     session_factory = _get_async_session()
     async with session_factory() as db:
         service = ScoringService(db=db)
@@ -187,10 +253,6 @@ async def _run_scoring(profile_id: int) -> None:
 
 
 async def _run_all_scoring() -> None:
-    from sqlalchemy import select
-
-    from app.models.profile import SearchProfile
-
     session_factory = _get_async_session()
     async with session_factory() as db:
         result = await db.execute(select(SearchProfile))
@@ -0,0 +1,37 @@
+"""add partial index for hot/warm leads
+
+Revision ID: f0b08060cfb1
+Revises: 8bc7b62dcf05
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f0b08060cfb1"
+down_revision: Union[str, Sequence[str], None] = "8bc7b62dcf05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Top hot/warm leads by score (lead board, conversion analytics) are
+    # served from this index alone instead of combining ix_lead_status and
+    # ix_lead_composite_score.
+    op.create_index(
+        "ix_lead_hot_warm_score",
+        "leads",
+        [sa.text("composite_score DESC")],
+        postgresql_include=["company_id", "search_profile_id"],
+        postgresql_where=sa.text("status IN ('hot', 'warm')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_lead_hot_warm_score", table_name="leads")
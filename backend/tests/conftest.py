@@ -1,23 +1,30 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import JSON, event
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.pool import StaticPool
 
 from app.config import settings
-from app.database import Base, get_db
+from app.database import Base, get_db, json_deserializer, json_serializer
 from app.main import app
+from app.models.profile import SearchProfile, SearchTerm
 
 # Disable file-based API cache during tests to prevent cross-test interference
 settings.api_cache_enabled = False
 
 
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
+# The models use Postgres JSONB; swap in the generic JSON type once at import so
+# SQLite creates and queries them as JSON without a per-compile dialect hook.
+for table in Base.metadata.tables.values():
+    for column in table.columns:
+        if isinstance(column.type, JSONB):
+            column.type = JSON()
 
 
 TEST_DATABASE_URL = "sqlite+aiosqlite://"
@@ -26,14 +33,30 @@ engine = create_async_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
-TestSessionLocal = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
 
 
-@pytest.fixture(autouse=True)
-async def setup_db():
+# pysqlite defers BEGIN and doesn't handle SAVEPOINT on its own; let SQLAlchemy
+# emit BEGIN so each test's outer transaction and savepoints behave.
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def create_schema():
+    """Configure mappers and create the schema once per session (per xdist worker).
+
+    The in-memory DB lives as long as the engine.
+    """
+    configure_mappers()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -43,18 +66,66 @@ async def setup_db():
 
 @pytest.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with TestSessionLocal() as session:
-        yield session
+    """Session joined to an outer transaction that is rolled back after the test.
 
+    Commits inside the test only release a savepoint, so every test starts
+    from the empty schema.
+    """
+    async with engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await conn.rollback()
 
-@pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    async def override_get_db():
-        yield db_session
 
-    app.dependency_overrides[get_db] = override_get_db
+@pytest_asyncio.fixture(scope="session")
+async def _http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One ASGI client for the whole session; DB isolation comes from `client`."""
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
         yield ac
+
+
+@pytest.fixture
+async def client(
+    db_session: AsyncSession, _http_client: AsyncClient
+) -> AsyncGenerator[AsyncClient, None]:
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield _http_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def seed_profiles(
+    db_session: AsyncSession,
+) -> Callable[[list[dict[str, Any]]], Awaitable[list[SearchProfile]]]:
+    """Insert profiles straight into the DB for tests that only need them as setup.
+
+    Each spec takes SearchProfile columns plus an optional ``search_terms``
+    list of SearchTerm column dicts. Everything goes in one flush instead of a
+    POST /api/profiles per profile.
+    """
+
+    async def seed(specs: list[dict[str, Any]]) -> list[SearchProfile]:
+        profiles = [
+            SearchProfile(
+                **{key: value for key, value in spec.items() if key != "search_terms"},
+                search_terms=[
+                    SearchTerm(**term) for term in spec.get("search_terms", [])
+                ],
+            )
+            for spec in specs
+        ]
+        db_session.add_all(profiles)
+        await db_session.flush()
+        return profiles
+
+    return seed
@@ -0,0 +1,17 @@
+"""Small helpers shared between test modules."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+def returning(value: Any = None) -> Callable[..., Awaitable[Any]]:
+    """Plain coroutine stub for calls a test doesn't assert on.
+
+    Accepts any arguments and returns ``value``; use ``AsyncMock`` where the
+    test inspects the calls.
+    """
+
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return stub
@@ -1,10 +1,11 @@
 """Tests for the file-based API response cache."""
 
 import json
+import os
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
-from app.utils.api_cache import cache_get, cache_put
+from app.utils.api_cache import _cache_key, _memory_cache, cache_get, cache_put
 
 
 def test_cache_put_and_get(tmp_path):
@@ -43,8 +44,6 @@ def test_cache_expiry(tmp_path):
         response = {"data": "old_result"}
 
         # Write cache entry with old timestamp
-        from app.utils.api_cache import _cache_key
-
         path = _cache_key("serpapi", params)
         old_date = (datetime.now(UTC) - timedelta(days=31)).isoformat()
         path.write_text(
@@ -64,6 +63,46 @@ def test_cache_expiry(tmp_path):
         assert cache_get("serpapi", params, max_age_days=0) == response
 
 
+def test_cache_expiry_from_file_mtime(tmp_path):
+    """Test that an old file mtime expires the entry without reading it."""
+    with patch("app.utils.api_cache.CACHE_DIR", tmp_path):
+        params = {"query": "stale"}
+        path = cache_put("serpapi", params, {"data": "stale_result"})
+
+        old_mtime = (datetime.now(UTC) - timedelta(days=31)).timestamp()
+        os.utime(path, (old_mtime, old_mtime))
+        _memory_cache.clear()  # force a read from disk, as in a fresh process
+
+        assert cache_get("serpapi", params, max_age_days=30) is None
+        assert cache_get("serpapi", params, max_age_days=0) == {"data": "stale_result"}
+
+
+def test_cache_served_from_memory(tmp_path):
+    """Test that repeat lookups in one process don't need the cache file."""
+    with patch("app.utils.api_cache.CACHE_DIR", tmp_path):
+        params = {"query": "memory"}
+        path = cache_put("serpapi", params, {"data": "memory_result"})
+        path.unlink()
+
+        assert cache_get("serpapi", params) == {"data": "memory_result"}
+
+
+def test_cache_memory_hits_are_copies(tmp_path):
+    """Test that mutating a cached or returned response doesn't leak into hits."""
+    with patch("app.utils.api_cache.CACHE_DIR", tmp_path):
+        params = {"query": "copies"}
+        response = {"data": ["a"], "seen": datetime(2024, 1, 1, tzinfo=UTC)}
+        cache_put("serpapi", params, response)
+        response["data"].append("b")
+
+        first = cache_get("serpapi", params)
+        first["data"].append("c")
+        second = cache_get("serpapi", params)
+
+        assert second == {"data": ["a"], "seen": "2024-01-01T00:00:00+00:00"}
+        assert second is not first
+
+
 def test_cache_creates_source_directories(tmp_path):
     """Test that cache creates subdirectories per source."""
     with patch("app.utils.api_cache.CACHE_DIR", tmp_path):
@@ -81,8 +120,6 @@ def test_cache_stores_metadata(tmp_path):
         cache_put("serpapi", params, {"data": "result"})
 
         # Read raw file
-        from app.utils.api_cache import _cache_key
-
         path = _cache_key("serpapi", params)
         raw = json.loads(path.read_text())
 
@@ -94,8 +131,6 @@ def test_cache_stores_metadata(tmp_path):
 def test_cache_deterministic_keys(tmp_path):
     """Test that the same params always produce the same cache key."""
     with patch("app.utils.api_cache.CACHE_DIR", tmp_path):
-        from app.utils.api_cache import _cache_key
-
         key1 = _cache_key("serpapi", {"a": 1, "b": 2})
         key2 = _cache_key("serpapi", {"b": 2, "a": 1})  # Different order
 
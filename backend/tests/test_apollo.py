@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 import httpx
 import pytest
@@ -9,53 +10,75 @@ from app.utils.ranges import employee_count_to_range, revenue_to_range
 
 @pytest.fixture
 def apollo_client() -> ApolloClient:
-    return ApolloClient(api_key="test-key", base_url="https://api.apollo.io/api/v1")
-
-
-MOCK_ORG_RESPONSE = {
-    "organization": {
-        "id": "org_abc123",
-        "name": "Acme B.V.",
-        "primary_domain": "acme.nl",
-        "estimated_num_employees": 150,
-        "annual_revenue": 25_000_000,
-        "industry": "Information Technology",
-        "keywords": ["software", "automation"],
-        "founded_year": 2010,
-        "linkedin_url": "https://linkedin.com/company/acme",
-        "website_url": "https://acme.nl",
-        "city": "Amsterdam",
-        "country": "Netherlands",
-    }
-}
+    client = ApolloClient(api_key="test-key", base_url="https://api.apollo.io/api/v1")
+    client._post = AsyncMock()
+    return client
 
-MOCK_PEOPLE_RESPONSE = {
-    "people": [
-        {
-            "name": "Jan de Vries",
-            "title": "CFO",
-            "email": "jan@acme.nl",
-            "linkedin_url": "https://linkedin.com/in/jandevries",
-            "phone_numbers": [{"sanitized_number": "+31612345678"}],
-        },
-        {
-            "name": "Petra Jansen",
-            "title": "Finance Manager",
-            "email": "petra@acme.nl",
-            "linkedin_url": "https://linkedin.com/in/petrajansen",
-            "phone_numbers": [],
-        },
-    ]
-}
+
+def _status_error(status_code: int, path: str) -> httpx.HTTPStatusError:
+    """Fresh HTTP error for _post to raise; the tests only care that it raises."""
+    return httpx.HTTPStatusError(
+        f"HTTP {status_code}",
+        request=httpx.Request("POST", f"https://api.apollo.io/api/v1/{path}"),
+        response=httpx.Response(status_code),
+    )
+
+
+# Read-only views: the responses are shared by every test, and the client must
+# not mutate what _post returns.
+MOCK_ORG_RESPONSE = MappingProxyType(
+    {
+        "organization": MappingProxyType(
+            {
+                "id": "org_abc123",
+                "name": "Acme B.V.",
+                "primary_domain": "acme.nl",
+                "estimated_num_employees": 150,
+                "annual_revenue": 25_000_000,
+                "industry": "Information Technology",
+                "keywords": ["software", "automation"],
+                "founded_year": 2010,
+                "linkedin_url": "https://linkedin.com/company/acme",
+                "website_url": "https://acme.nl",
+                "city": "Amsterdam",
+                "country": "Netherlands",
+            }
+        )
+    }
+)
+
+MOCK_PEOPLE_RESPONSE = MappingProxyType(
+    {
+        "people": (
+            MappingProxyType(
+                {
+                    "name": "Jan de Vries",
+                    "title": "CFO",
+                    "email": "jan@acme.nl",
+                    "linkedin_url": "https://linkedin.com/in/jandevries",
+                    "phone_numbers": [{"sanitized_number": "+31612345678"}],
+                }
+            ),
+            MappingProxyType(
+                {
+                    "name": "Petra Jansen",
+                    "title": "Finance Manager",
+                    "email": "petra@acme.nl",
+                    "linkedin_url": "https://linkedin.com/in/petrajansen",
+                    "phone_numbers": [],
+                }
+            ),
+        )
+    }
+)
 
 
 @pytest.mark.asyncio
 async def test_enrich_company_success(apollo_client: ApolloClient):
     """Test successful company enrichment by name."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = MOCK_ORG_RESPONSE
+    apollo_client._post.return_value = MOCK_ORG_RESPONSE
 
-        result = await apollo_client.enrich_company(name="Acme B.V.")
+    result = await apollo_client.enrich_company(name="Acme B.V.")
 
     assert result is not None
     assert isinstance(result, ApolloCompanyData)
@@ -75,7 +98,7 @@ async def test_enrich_company_success(apollo_client: ApolloClient):
     assert result.apollo_id == "org_abc123"
     assert result.raw_data == MOCK_ORG_RESPONSE["organization"]
 
-    mock_post.assert_called_once_with(
+    apollo_client._post.assert_called_once_with(
         "organizations/enrich", {"organization_name": "Acme B.V."}
     )
 
@@ -83,13 +106,12 @@ async def test_enrich_company_success(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_enrich_company_by_domain(apollo_client: ApolloClient):
     """Test enrichment by domain takes priority in the payload."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = MOCK_ORG_RESPONSE
+    apollo_client._post.return_value = MOCK_ORG_RESPONSE
 
-        result = await apollo_client.enrich_company(name="Acme B.V.", domain="acme.nl")
+    result = await apollo_client.enrich_company(name="Acme B.V.", domain="acme.nl")
 
     assert result is not None
-    mock_post.assert_called_once_with(
+    apollo_client._post.assert_called_once_with(
         "organizations/enrich",
         {"domain": "acme.nl", "organization_name": "Acme B.V."},
     )
@@ -98,10 +120,9 @@ async def test_enrich_company_by_domain(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_enrich_company_no_org_found(apollo_client: ApolloClient):
     """Test graceful handling when Apollo returns no organization data."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = {"organization": None}
+    apollo_client._post.return_value = {"organization": None}
 
-        result = await apollo_client.enrich_company(name="Unknown Corp")
+    result = await apollo_client.enrich_company(name="Unknown Corp")
 
     assert result is None
 
@@ -109,10 +130,9 @@ async def test_enrich_company_no_org_found(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_enrich_company_empty_response(apollo_client: ApolloClient):
     """Test graceful handling when Apollo returns empty response."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = {}
+    apollo_client._post.return_value = {}
 
-        result = await apollo_client.enrich_company(name="Unknown Corp")
+    result = await apollo_client.enrich_company(name="Unknown Corp")
 
     assert result is None
 
@@ -120,16 +140,9 @@ async def test_enrich_company_empty_response(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_enrich_company_api_error(apollo_client: ApolloClient):
     """Test graceful handling of API errors."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.HTTPStatusError(
-            "Rate limited",
-            request=httpx.Request(
-                "POST", "https://api.apollo.io/api/v1/organizations/enrich"
-            ),
-            response=httpx.Response(429),
-        )
+    apollo_client._post.side_effect = _status_error(429, "organizations/enrich")
 
-        result = await apollo_client.enrich_company(name="Acme B.V.")
+    result = await apollo_client.enrich_company(name="Acme B.V.")
 
     assert result is None
 
@@ -145,14 +158,13 @@ async def test_enrich_company_no_name_or_domain(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_search_contacts_success(apollo_client: ApolloClient):
     """Test successful contact search."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = MOCK_PEOPLE_RESPONSE
+    apollo_client._post.return_value = MOCK_PEOPLE_RESPONSE
 
-        contacts = await apollo_client.search_contacts(
-            apollo_org_id="org_abc123",
-            titles=["CFO", "Finance Manager"],
-            limit=5,
-        )
+    contacts = await apollo_client.search_contacts(
+        apollo_org_id="org_abc123",
+        titles=["CFO", "Finance Manager"],
+        limit=5,
+    )
 
     assert len(contacts) == 2
     assert all(isinstance(c, ApolloContact) for c in contacts)
@@ -167,7 +179,7 @@ async def test_search_contacts_success(apollo_client: ApolloClient):
     assert contacts[1].title == "Finance Manager"
     assert contacts[1].phone is None  # Empty phone_numbers list
 
-    mock_post.assert_called_once_with(
+    apollo_client._post.assert_called_once_with(
         "mixed_people/search",
         {
             "organization_ids": ["org_abc123"],
@@ -180,13 +192,12 @@ async def test_search_contacts_success(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_search_contacts_no_titles(apollo_client: ApolloClient):
     """Test contact search without title filter."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = {"people": []}
+    apollo_client._post.return_value = {"people": []}
 
-        contacts = await apollo_client.search_contacts(apollo_org_id="org_abc123")
+    contacts = await apollo_client.search_contacts(apollo_org_id="org_abc123")
 
     assert contacts == []
-    mock_post.assert_called_once_with(
+    apollo_client._post.assert_called_once_with(
         "mixed_people/search",
         {"organization_ids": ["org_abc123"], "per_page": 5},
     )
@@ -195,82 +206,49 @@ async def test_search_contacts_no_titles(apollo_client: ApolloClient):
 @pytest.mark.asyncio
 async def test_search_contacts_api_error(apollo_client: ApolloClient):
     """Test graceful handling of contact search errors."""
-    with patch.object(apollo_client, "_post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.HTTPStatusError(
-            "Server error",
-            request=httpx.Request(
-                "POST", "https://api.apollo.io/api/v1/mixed_people/search"
-            ),
-            response=httpx.Response(500),
-        )
+    apollo_client._post.side_effect = _status_error(500, "mixed_people/search")
 
-        contacts = await apollo_client.search_contacts(apollo_org_id="org_abc123")
+    contacts = await apollo_client.search_contacts(apollo_org_id="org_abc123")
 
     assert contacts == []
 
 
-class TestEmployeeCountToRange:
-    """Test the _employee_count_to_range static method."""
-
-    def test_micro(self):
-        assert employee_count_to_range(5) == "1-9"
-
-    def test_small(self):
-        assert employee_count_to_range(25) == "10-49"
-
-    def test_medium_small(self):
-        assert employee_count_to_range(75) == "50-99"
-
-    def test_medium(self):
-        assert employee_count_to_range(150) == "100-199"
-
-    def test_medium_large(self):
-        assert employee_count_to_range(350) == "200-499"
-
-    def test_large(self):
-        assert employee_count_to_range(750) == "500-999"
-
-    def test_enterprise(self):
-        assert employee_count_to_range(5000) == "1000+"
-
-    def test_boundary_10(self):
-        assert employee_count_to_range(9) == "1-9"
-        assert employee_count_to_range(10) == "10-49"
-
-    def test_boundary_50(self):
-        assert employee_count_to_range(49) == "10-49"
-        assert employee_count_to_range(50) == "50-99"
-
-    def test_boundary_1000(self):
-        assert employee_count_to_range(999) == "500-999"
-        assert employee_count_to_range(1000) == "1000+"
-
-
-class TestRevenueToRange:
-    """Test the _revenue_to_range static method."""
-
-    def test_under_1m(self):
-        assert revenue_to_range(500_000) == "<1M"
-
-    def test_1m_to_10m(self):
-        assert revenue_to_range(5_000_000) == "1M-10M"
-
-    def test_10m_to_50m(self):
-        assert revenue_to_range(25_000_000) == "10M-50M"
-
-    def test_50m_to_100m(self):
-        assert revenue_to_range(75_000_000) == "50M-100M"
-
-    def test_100m_to_500m(self):
-        assert revenue_to_range(250_000_000) == "100M-500M"
-
-    def test_over_500m(self):
-        assert revenue_to_range(1_000_000_000) == "500M+"
-
-    def test_boundary_1m(self):
-        assert revenue_to_range(999_999) == "<1M"
-        assert revenue_to_range(1_000_000) == "1M-10M"
-
-    def test_boundary_500m(self):
-        assert revenue_to_range(499_999_999) == "100M-500M"
-        assert revenue_to_range(500_000_000) == "500M+"
+@pytest.mark.parametrize(
+    ("count", "expected"),
+    [
+        (5, "1-9"),
+        (25, "10-49"),
+        (75, "50-99"),
+        (150, "100-199"),
+        (350, "200-499"),
+        (750, "500-999"),
+        (5000, "1000+"),
+        (9, "1-9"),
+        (10, "10-49"),
+        (49, "10-49"),
+        (50, "50-99"),
+        (999, "500-999"),
+        (1000, "1000+"),
+    ],
+)
+def test_employee_count_to_range(count: int, expected: str):
+    assert employee_count_to_range(count) == expected
+
+
+@pytest.mark.parametrize(
+    ("revenue", "expected"),
+    [
+        (500_000, "<1M"),
+        (5_000_000, "1M-10M"),
+        (25_000_000, "10M-50M"),
+        (75_000_000, "50M-100M"),
+        (250_000_000, "100M-500M"),
+        (1_000_000_000, "500M+"),
+        (999_999, "<1M"),
+        (1_000_000, "1M-10M"),
+        (499_999_999, "100M-500M"),
+        (500_000_000, "500M+"),
+    ],
+)
+def test_revenue_to_range(revenue: int, expected: str):
+    assert revenue_to_range(revenue) == expected
@@ -1,16 +1,11 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 import pytest
 
 from app.integrations.claude_llm import ClaudeLLMClient, ExtractionResult
 
-
-@pytest.fixture(autouse=True)
-async def setup_db():
-    """Override the global setup_db fixture — these tests don't need a database."""
-    yield
-
-
 MOCK_VACANCY_TEXT = """
 Wij zoeken een ervaren crediteurenadministrateur voor ons team in Amsterdam.
 Je werkt dagelijks met SAP en Exact Online. Het team bestaat uit 5 medewerkers
@@ -19,32 +14,78 @@ Wij zijn een internationale organisatie met vestigingen in 3 landen.
 Ervaring met Basware is een pre.
 """
 
-MOCK_EXTRACTION_SCHEMA = {
-    "erp_systems": "Which ERP systems are mentioned? (SAP, Oracle, Exact, AFAS, etc.)",
-    "p2p_tools": "Which P2P/AP automation tools are mentioned? (Basware, Coupa, etc.)",
-    "team_size": "Any indication of team size?",
-    "volume_indicators": "Any mention of invoice volumes, transaction counts?",
-    "complexity_signals": "International operations, multiple entities, languages?",
-    "automation_status": "Current level of automation mentioned?",
-}
+MOCK_EXTRACTION_SCHEMA = MappingProxyType(
+    {
+        "erp_systems": (
+            "Which ERP systems are mentioned? (SAP, Oracle, Exact, AFAS, etc.)"
+        ),
+        "p2p_tools": (
+            "Which P2P/AP automation tools are mentioned? (Basware, Coupa, etc.)"
+        ),
+        "team_size": "Any indication of team size?",
+        "volume_indicators": "Any mention of invoice volumes, transaction counts?",
+        "complexity_signals": "International operations, multiple entities, languages?",
+        "automation_status": "Current level of automation mentioned?",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def claude_client() -> ClaudeLLMClient:
+    return ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-20250514")
+
+
+@pytest.fixture(autouse=True)
+def mock_create(claude_client: ClaudeLLMClient) -> AsyncMock:
+    """Give every test a fresh messages.create mock on the shared client."""
+    claude_client._client.messages.create = AsyncMock()
+    return claude_client._client.messages.create
+
+
+@dataclass(slots=True)
+class _ToolUseBlock:
+    type: str
+    name: str
+    input: dict
 
 
-def _mock_tool_use_response(extracted: dict) -> MagicMock:
-    """Build a mock Anthropic response with tool_use content block."""
-    tool_block = MagicMock()
-    tool_block.type = "tool_use"
-    tool_block.name = "extract_vacancy_data"
-    tool_block.input = extracted
+@dataclass(slots=True)
+class _Usage:
+    input_tokens: int
+    output_tokens: int
 
-    usage = MagicMock()
-    usage.input_tokens = 500
-    usage.output_tokens = 200
 
-    response = MagicMock()
-    response.content = [tool_block]
-    response.usage = usage
-    response.stop_reason = "tool_use"
-    return response
+@dataclass(slots=True)
+class _Response:
+    content: list[_ToolUseBlock]
+    usage: _Usage
+    stop_reason: str
+
+
+def _mock_tool_use_response(extracted: dict) -> _Response:
+    """Build a stand-in Anthropic response with a tool_use content block.
+
+    The tool input is a copy, since the client fills missing fields into it in
+    place.
+    """
+    return _Response(
+        content=[_ToolUseBlock("tool_use", "extract_vacancy_data", dict(extracted))],
+        usage=_Usage(input_tokens=500, output_tokens=200),
+        stop_reason="tool_use",
+    )
+
+
+MOCK_FULL_EXTRACTION = {
+    "erp_systems": ["SAP", "Exact Online"],
+    "p2p_tools": ["Basware"],
+    "team_size": "5 medewerkers",
+    "volume_indicators": "15.000 inkoopfacturen per jaar",
+    "complexity_signals": "internationale organisatie, 3 landen",
+    "automation_status": "unknown",
+}
+
+# Response missing expected fields
+MOCK_PARTIAL_EXTRACTION = {"erp_systems": ["SAP"]}
 
 
 def test_extraction_result_dataclass():
@@ -60,32 +101,18 @@ def test_extraction_result_dataclass():
 
 
 @pytest.mark.asyncio
-async def test_extract_vacancy_data():
-    client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-20250514")
-
-    mock_extracted = {
-        "erp_systems": ["SAP", "Exact Online"],
-        "p2p_tools": ["Basware"],
-        "team_size": "5 medewerkers",
-        "volume_indicators": "15.000 inkoopfacturen per jaar",
-        "complexity_signals": "internationale organisatie, 3 landen",
-        "automation_status": "unknown",
-    }
-
-    with patch.object(
-        client._client.messages,
-        "create",
-        new_callable=AsyncMock,
-        return_value=_mock_tool_use_response(mock_extracted),
-    ):
-        result = await client.extract_vacancy_data(
-            vacancy_text=MOCK_VACANCY_TEXT,
-            extraction_schema=MOCK_EXTRACTION_SCHEMA,
-            system_prompt=(
-                "You are an expert at extracting structured data "
-                "from job vacancy texts."
-            ),
-        )
+async def test_extract_vacancy_data(
+    claude_client: ClaudeLLMClient, mock_create: AsyncMock
+):
+    mock_create.return_value = _mock_tool_use_response(MOCK_FULL_EXTRACTION)
+
+    result = await claude_client.extract_vacancy_data(
+        vacancy_text=MOCK_VACANCY_TEXT,
+        extraction_schema=MOCK_EXTRACTION_SCHEMA,
+        system_prompt=(
+            "You are an expert at extracting structured data from job vacancy texts."
+        ),
+    )
 
     assert result.success is True
     assert "SAP" in result.extracted_data["erp_systems"]
@@ -94,20 +121,16 @@ async def test_extract_vacancy_data():
 
 
 @pytest.mark.asyncio
-async def test_extract_handles_api_error():
-    client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-20250514")
-
-    with patch.object(
-        client._client.messages,
-        "create",
-        new_callable=AsyncMock,
-        side_effect=Exception("API rate limit exceeded"),
-    ):
-        result = await client.extract_vacancy_data(
-            vacancy_text="Some vacancy text",
-            extraction_schema=MOCK_EXTRACTION_SCHEMA,
-            system_prompt="Extract data.",
-        )
+async def test_extract_handles_api_error(
+    claude_client: ClaudeLLMClient, mock_create: AsyncMock
+):
+    mock_create.side_effect = Exception("API rate limit exceeded")
+
+    result = await claude_client.extract_vacancy_data(
+        vacancy_text="Some vacancy text",
+        extraction_schema=MOCK_EXTRACTION_SCHEMA,
+        system_prompt="Extract data.",
+    )
 
     assert result.success is False
     assert result.error is not None
@@ -115,32 +138,27 @@ async def test_extract_handles_api_error():
 
 
 @pytest.mark.asyncio
-async def test_extract_validates_output_schema():
-    client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-20250514")
-
-    # Response missing expected fields
-    mock_extracted = {"erp_systems": ["SAP"]}  # Missing other fields
-
-    with patch.object(
-        client._client.messages,
-        "create",
-        new_callable=AsyncMock,
-        return_value=_mock_tool_use_response(mock_extracted),
-    ):
-        result = await client.extract_vacancy_data(
-            vacancy_text="Some text",
-            extraction_schema=MOCK_EXTRACTION_SCHEMA,
-            system_prompt="Extract data.",
-        )
+async def test_extract_validates_output_schema(
+    claude_client: ClaudeLLMClient, mock_create: AsyncMock
+):
+    mock_create.return_value = _mock_tool_use_response(MOCK_PARTIAL_EXTRACTION)
+
+    result = await claude_client.extract_vacancy_data(
+        vacancy_text="Some text",
+        extraction_schema=MOCK_EXTRACTION_SCHEMA,
+        system_prompt="Extract data.",
+    )
 
     # Should still succeed but fill missing fields with None
     assert result.success is True
     assert result.extracted_data.get("p2p_tools") is None
+    assert MOCK_PARTIAL_EXTRACTION == {"erp_systems": ["SAP"]}
 
 
-def test_build_tool_definition():
-    client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-20250514")
-    tool = client._build_extraction_tool(MOCK_EXTRACTION_SCHEMA)
+def test_build_tool_definition(claude_client: ClaudeLLMClient):
+    tool = claude_client._build_extraction_tool(MOCK_EXTRACTION_SCHEMA)
     assert tool["name"] == "extract_vacancy_data"
     assert "erp_systems" in tool["input_schema"]["properties"]
     assert len(tool["input_schema"]["properties"]) == 6
+    # Built once per schema
+    assert claude_client._build_extraction_tool(MOCK_EXTRACTION_SCHEMA) is tool
@@ -1,7 +1,5 @@
 import pytest
 from sqlalchemy import func, select, text
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.compiler import compiles
 
 from app.models.company import Company
 from app.models.profile import SearchProfile
@@ -9,11 +7,6 @@ from app.models.vacancy import Vacancy
 from app.services.dedup import merge_companies_by_kvk
 
 
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
-
-
 @pytest.fixture
 async def _allow_duplicate_kvk(db_session):
     """Drop the unique index on kvk_number so we can insert test duplicates.
@@ -28,25 +21,24 @@ async def _allow_duplicate_kvk(db_session):
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("_allow_duplicate_kvk")
 async def test_merge_companies_with_same_kvk(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
-    db_session.add(profile)
-    await db_session.flush()
-
+    # Explicit primary keys let the vacancies reference their profile and
+    # companies before anything is flushed, so everything goes in the one
+    # autoflush triggered by the merge query.
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     c1 = Company(
+        id=1,
         name="Acme B.V.",
         normalized_name="acme",
         kvk_number="12345678",
         employee_range="100-199",
     )
     c2 = Company(
+        id=2,
         name="Acme Holding",
         normalized_name="acme holding",
         kvk_number="12345678",
         employee_range=None,
     )
-    db_session.add_all([c1, c2])
-    await db_session.flush()
-
     v1 = Vacancy(
         external_id="v1",
         source="google_jobs",
@@ -65,8 +57,7 @@ async def test_merge_companies_with_same_kvk(db_session):
         job_title="AP 2",
         raw_text="Text",
     )
-    db_session.add_all([v1, v2])
-    await db_session.flush()
+    db_session.add_all([profile, c1, c2, v1, v2])
 
     merged_count = await merge_companies_by_kvk(db_session)
     assert merged_count == 1  # One merge happened
@@ -104,7 +95,6 @@ async def test_merge_keeps_richest_data(db_session):
         revenue_range="10M-50M",
     )
     db_session.add_all([c1, c2])
-    await db_session.flush()
 
     await merge_companies_by_kvk(db_session)
 
@@ -123,7 +113,6 @@ async def test_no_merge_needed(db_session):
     c1 = Company(name="Acme", normalized_name="acme", kvk_number="11111111")
     c2 = Company(name="Globex", normalized_name="globex", kvk_number="22222222")
     db_session.add_all([c1, c2])
-    await db_session.flush()
 
     merged_count = await merge_companies_by_kvk(db_session)
     assert merged_count == 0
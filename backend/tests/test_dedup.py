@@ -1,31 +1,38 @@
 import pytest
+from sqlalchemy import event, func, inspect, select
 
-from app.services.dedup import find_or_create_company, normalize_company_name
+from app.models.company import Company
+from app.services.dedup import (
+    _COMPANY_IDS_KEY,
+    find_or_create_company,
+    normalize_company_name,
+)
 
 
-def test_normalize_strips_legal_suffixes():
-    assert normalize_company_name("Acme B.V.") == "acme"
-    assert normalize_company_name("Globex N.V.") == "globex"
-    assert normalize_company_name("Test BV") == "test"
-    assert normalize_company_name("Widget NV") == "widget"
-
-
-def test_normalize_strips_whitespace_and_punctuation():
-    assert normalize_company_name("  Acme Corp.  ") == "acme corp"
-    assert normalize_company_name("Foo & Bar") == "foo bar"
-    assert normalize_company_name("ABC - XYZ") == "abc xyz"
-
-
-def test_normalize_handles_common_suffixes():
-    assert normalize_company_name("Tech Solutions B.V.") == "tech solutions"
-    assert normalize_company_name("InnoGroup Holding B.V.") == "innogroup holding"
-    assert normalize_company_name("Digital Services GmbH") == "digital services"
-    assert normalize_company_name("Consulting Ltd.") == "consulting"
-
-
-def test_normalize_empty_and_whitespace():
-    assert normalize_company_name("") == ""
-    assert normalize_company_name("   ") == ""
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        # Legal suffixes
+        ("Acme B.V.", "acme"),
+        ("Globex N.V.", "globex"),
+        ("Test BV", "test"),
+        ("Widget NV", "widget"),
+        # Whitespace and punctuation
+        ("  Acme Corp.  ", "acme corp"),
+        ("Foo & Bar", "foo bar"),
+        ("ABC - XYZ", "abc xyz"),
+        # Common suffixes that are part of the name
+        ("Tech Solutions B.V.", "tech solutions"),
+        ("InnoGroup Holding B.V.", "innogroup holding"),
+        ("Digital Services GmbH", "digital services"),
+        ("Consulting Ltd.", "consulting"),
+        # Empty and whitespace
+        ("", ""),
+        ("   ", ""),
+    ],
+)
+def test_normalize_company_name(raw: str, expected: str):
+    assert normalize_company_name(raw) == expected
 
 
 @pytest.mark.asyncio
@@ -51,3 +58,63 @@ async def test_find_or_create_preserves_original_name(db_session):
     # Second call with different casing doesn't overwrite
     company2 = await find_or_create_company(db_session, "ACME bv")
     assert company2.name == "Acme B.V."
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_repeat_lookup_skips_select(db_session):
+    company = await find_or_create_company(db_session, "Acme B.V.")
+
+    statements = []
+
+    def record(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    event.listen(db_session.sync_session, "do_orm_execute", record)
+    try:
+        again = await find_or_create_company(db_session, "ACME bv")
+    finally:
+        event.remove(db_session.sync_session, "do_orm_execute", record)
+
+    assert again is company
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_forgets_ids_on_rollback(db_session):
+    await find_or_create_company(db_session, "Acme B.V.")
+    assert _COMPANY_IDS_KEY in db_session.info
+
+    await db_session.rollback()
+
+    assert _COMPANY_IDS_KEY not in db_session.info
+    company = await find_or_create_company(db_session, "Acme B.V.")
+    count = await db_session.scalar(select(func.count(Company.id)))
+    assert count == 1
+    assert db_session.info[_COMPANY_IDS_KEY] == {"acme": company.id}
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_forgets_ids_on_savepoint_rollback(db_session):
+    savepoint = await db_session.begin_nested()
+    await find_or_create_company(db_session, "Acme B.V.")
+    await savepoint.rollback()
+
+    assert _COMPANY_IDS_KEY not in db_session.info
+    company = await find_or_create_company(db_session, "Acme B.V.")
+    count = await db_session.scalar(select(func.count(Company.id)))
+    assert count == 1
+    assert company.normalized_name == "acme"
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_ignores_deleted_cached_company(db_session):
+    company = await find_or_create_company(db_session, "Acme B.V.")
+    await db_session.delete(company)
+    await db_session.flush()
+
+    recreated = await find_or_create_company(db_session, "Acme B.V.")
+
+    assert recreated is not company
+    assert inspect(recreated).persistent
+    count = await db_session.scalar(select(func.count(Company.id)))
+    assert count == 1
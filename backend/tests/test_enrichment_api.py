@@ -2,23 +2,19 @@ from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.compiler import compiles
 
+from app.models.profile import SearchProfile
 
-# SQLite doesn't support JSONB — compile it as JSON for tests
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
 
+@pytest.fixture
+async def profile(seed_profiles) -> SearchProfile:
+    """Seed the profile directly instead of round-tripping through the API."""
+    [profile] = await seed_profiles([{"name": "AP", "slug": "ap"}])
+    return profile
 
-@pytest.mark.asyncio
-async def test_trigger_enrichment(client: AsyncClient):
-    await client.post(
-        "/api/profiles",
-        json={"name": "AP", "slug": "ap", "search_terms": []},
-    )
 
+@pytest.mark.asyncio
+async def test_trigger_enrichment(client: AsyncClient, profile: SearchProfile):
     with (
         patch("app.worker.has_celery_workers", return_value=True),
         patch("app.worker.trigger_enrichment_task") as mock_task,
@@ -26,11 +22,12 @@ async def test_trigger_enrichment(client: AsyncClient):
         mock_task.delay = lambda *a, **kw: type("obj", (), {"id": "test-task-id"})()
         response = await client.post(
             "/api/enrichment/trigger",
-            json={"profile_id": 1, "pass_type": "both"},
+            json={"profile_id": profile.id, "pass_type": "both"},
         )
     assert response.status_code == 202
     data = response.json()
     assert data["status"] == "queued"
+    assert data["profile_id"] == profile.id
     assert data["pass_type"] == "both"
 
 
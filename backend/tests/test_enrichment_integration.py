@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.integrations.apollo import ApolloCompanyData
@@ -12,6 +12,8 @@ from app.integrations.claude_llm import ExtractionResult
 from app.integrations.kvk import KvKCompanyData
 from app.models.company import Company
 from app.scrapers.serpapi import SerpApiResult
+from app.services.enrichment import EnrichmentOrchestrator
+from app.services.harvester import HarvestService
 
 MOCK_HARVEST_RESULTS = [
     SerpApiResult(
@@ -48,6 +50,75 @@ MOCK_HARVEST_RESULTS = [
     ),
 ]
 
+# LLM responses for each vacancy
+MOCK_EXTRACTIONS = {
+    "gj_101": ExtractionResult(
+        extracted_data={
+            "erp_systems": ["SAP"],
+            "team_size": "8 medewerkers",
+            "volume_indicators": "200 facturen per dag",
+            "complexity_signals": "4 landen",
+        },
+        tokens_input=400,
+        tokens_output=150,
+        model="claude-sonnet-4-20250514",
+        success=True,
+    ),
+    "gj_102": ExtractionResult(
+        extracted_data={
+            "erp_systems": ["Exact Online"],
+            "team_size": None,
+            "volume_indicators": None,
+            "complexity_signals": None,
+        },
+        tokens_input=200,
+        tokens_output=100,
+        model="claude-sonnet-4-20250514",
+        success=True,
+    ),
+    "gj_103": ExtractionResult(
+        extracted_data={
+            "erp_systems": None,
+            "team_size": None,
+            "volume_indicators": None,
+            "complexity_signals": None,
+        },
+        tokens_input=150,
+        tokens_output=80,
+        model="claude-sonnet-4-20250514",
+        success=True,
+    ),
+}
+
+
+# The extraction service sends each vacancy's raw_text, which the harvest stores
+# verbatim from the result's description.
+_EXTRACTION_BY_TEXT = {
+    result.description: MOCK_EXTRACTIONS[result.external_id]
+    for result in MOCK_HARVEST_RESULTS
+}
+
+
+async def _mock_extract(vacancy_text, extraction_schema, system_prompt):
+    return _EXTRACTION_BY_TEXT[vacancy_text]
+
+
+MOCK_KVK = KvKCompanyData(
+    kvk_number="12345678",
+    name="TechCorp B.V.",
+    sbi_codes=[{"code": "6201", "description": "Software"}],
+    employee_count=150,
+    entity_count=4,
+)
+MOCK_APOLLO = ApolloCompanyData(
+    name="TechCorp B.V.",
+    employee_count=150,
+    employee_range="100-199",
+    revenue_range="10M-50M",
+    apollo_id="org_tech123",
+    raw_data={"id": "org_tech123", "name": "TechCorp B.V."},
+)
+
 
 @pytest.mark.asyncio
 async def test_full_harvest_to_enrichment_pipeline(
@@ -85,8 +156,6 @@ async def test_full_harvest_to_enrichment_pipeline(
     assert response.status_code == 201
 
     # 2. Run harvest (mocked)
-    from app.services.harvester import HarvestService
-
     harvest_service = HarvestService(db=db_session)
     with patch.object(
         harvest_service,
@@ -100,131 +169,45 @@ async def test_full_harvest_to_enrichment_pipeline(
 
     assert harvest_run.vacancies_new == 3
 
-    # Verify company dedup: TechCorp B.V. and TechCorp BV = same company
-    company_count = await db_session.scalar(select(func.count(Company.id)))
-    assert company_count == 2  # TechCorp + MiniStartup
-
     # 3. Run Pass 1: LLM extraction (mocked)
-    from app.services.enrichment import EnrichmentOrchestrator
-
-    # Mock LLM responses for each vacancy
-    mock_extractions = {
-        "gj_101": ExtractionResult(
-            extracted_data={
-                "erp_systems": ["SAP"],
-                "team_size": "8 medewerkers",
-                "volume_indicators": "200 facturen per dag",
-                "complexity_signals": "4 landen",
-            },
-            tokens_input=400,
-            tokens_output=150,
-            model="claude-sonnet-4-20250514",
-            success=True,
-        ),
-        "gj_102": ExtractionResult(
-            extracted_data={
-                "erp_systems": ["Exact Online"],
-                "team_size": None,
-                "volume_indicators": None,
-                "complexity_signals": None,
-            },
-            tokens_input=200,
-            tokens_output=100,
-            model="claude-sonnet-4-20250514",
-            success=True,
-        ),
-        "gj_103": ExtractionResult(
-            extracted_data={
-                "erp_systems": None,
-                "team_size": None,
-                "volume_indicators": None,
-                "complexity_signals": None,
-            },
-            tokens_input=150,
-            tokens_output=80,
-            model="claude-sonnet-4-20250514",
-            success=True,
-        ),
-    }
-
-    async def mock_extract(vacancy_text, extraction_schema, system_prompt):
-        # Match by looking for keywords in the vacancy text
-        if "SAP" in vacancy_text:
-            return mock_extractions["gj_101"]
-        elif "Exact Online" in vacancy_text:
-            return mock_extractions["gj_102"]
-        else:
-            return mock_extractions["gj_103"]
-
     orchestrator = EnrichmentOrchestrator(db=db_session)
 
-    with patch.object(
-        orchestrator._extraction_service._llm_client,
-        "extract_vacancy_data",
-        side_effect=mock_extract,
-    ):
-        result = await orchestrator.run_full_enrichment(
-            profile_id=profile_id, pass_type="llm"
-        )
+    orchestrator._extraction_service._llm_client.extract_vacancy_data = _mock_extract
+
+    result = await orchestrator.run_full_enrichment(
+        profile_id=profile_id, pass_type="llm"
+    )
 
     assert result["llm_run"].status == "completed"
     assert result["llm_run"].items_succeeded == 3
 
-    # Verify extraction quality scores
-    techcorp = await db_session.execute(
-        select(Company).where(Company.normalized_name == "techcorp")
-    )
-    techcorp_company = techcorp.scalar_one()
+    # Verify extraction quality scores, loading every company in one query.
+    # Company dedup: TechCorp B.V. and TechCorp BV must be a single company.
+    companies = (await db_session.scalars(select(Company))).all()
+    by_name = {company.normalized_name: company for company in companies}
+    assert len(companies) == 2
+    assert by_name.keys() == {"techcorp", "ministartup"}
+
+    techcorp_company = by_name["techcorp"]
     # gj_101: 4/4 = 1.0, gj_102: 1/4 = 0.25, average = 0.625
     assert techcorp_company.extraction_quality == 0.625
 
-    ministartup = await db_session.execute(
-        select(Company).where(Company.normalized_name == "ministartup")
-    )
-    ministartup_company = ministartup.scalar_one()
+    ministartup_company = by_name["ministartup"]
     # gj_103: 0/4 = 0.0
     assert ministartup_company.extraction_quality == 0.0
 
     # 4. Run Pass 2: External enrichment (mocked)
-    mock_kvk = KvKCompanyData(
-        kvk_number="12345678",
-        name="TechCorp B.V.",
-        sbi_codes=[{"code": "6201", "description": "Software"}],
-        employee_count=150,
-        entity_count=4,
-    )
-    mock_apollo = ApolloCompanyData(
-        name="TechCorp B.V.",
-        employee_count=150,
-        employee_range="100-199",
-        revenue_range="10M-50M",
-        apollo_id="org_tech123",
-        raw_data={"id": "org_tech123", "name": "TechCorp B.V."},
+    # The clients belong to this test's orchestrator; assign the mocks directly.
+    kvk_client = orchestrator._external_service._kvk_client
+    kvk_client.find_kvk_number = AsyncMock(return_value="12345678")
+    kvk_client.get_company_profile = AsyncMock(return_value=MOCK_KVK)
+    orchestrator._external_service._apollo_client.enrich_company = AsyncMock(
+        return_value=MOCK_APOLLO
     )
 
-    with (
-        patch.object(
-            orchestrator._external_service._kvk_client,
-            "find_kvk_number",
-            new_callable=AsyncMock,
-            return_value="12345678",
-        ),
-        patch.object(
-            orchestrator._external_service._kvk_client,
-            "get_company_profile",
-            new_callable=AsyncMock,
-            return_value=mock_kvk,
-        ),
-        patch.object(
-            orchestrator._external_service._apollo_client,
-            "enrich_company",
-            new_callable=AsyncMock,
-            return_value=mock_apollo,
-        ),
-    ):
-        result = await orchestrator.run_full_enrichment(
-            profile_id=profile_id, pass_type="external"
-        )
+    result = await orchestrator.run_full_enrichment(
+        profile_id=profile_id, pass_type="external"
+    )
 
     ext_run = result["external_run"]
     assert ext_run.status == "completed"
@@ -234,7 +217,16 @@ async def test_full_harvest_to_enrichment_pipeline(
     assert ext_run.items_succeeded == 1
 
     # Verify TechCorp is enriched
-    await db_session.refresh(techcorp_company)
+    await db_session.refresh(
+        techcorp_company,
+        attribute_names=[
+            "kvk_number",
+            "sbi_codes",
+            "employee_range",
+            "entity_count",
+            "enrichment_status",
+        ],
+    )
     assert techcorp_company.kvk_number == "12345678"
     assert techcorp_company.sbi_codes == [{"code": "6201", "description": "Software"}]
     assert techcorp_company.employee_range == "100-199"
@@ -242,7 +234,7 @@ async def test_full_harvest_to_enrichment_pipeline(
     assert techcorp_company.enrichment_status == "completed"
 
     # Verify MiniStartup was NOT enriched
-    await db_session.refresh(ministartup_company)
+    await db_session.refresh(ministartup_company, attribute_names=["enrichment_status"])
     assert ministartup_company.enrichment_status == "pending"
 
     # 5. Verify enrichment runs via API
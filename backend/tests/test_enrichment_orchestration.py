@@ -1,8 +1,6 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.compiler import compiles
 
 from app.models.company import Company
 from app.models.enrichment import EnrichmentRun
@@ -10,18 +8,13 @@ from app.models.extraction_prompt import ExtractionPrompt
 from app.models.profile import SearchProfile
 from app.models.vacancy import Vacancy
 from app.services.enrichment import EnrichmentOrchestrator
-
-
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
+from tests.helpers import returning
 
 
 @pytest.mark.asyncio
 async def test_orchestrate_both_passes(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     db_session.add(profile)
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -31,11 +24,11 @@ async def test_orchestrate_both_passes(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
-    company = Company(name="Acme", normalized_name="acme", enrichment_status="pending")
+    company = Company(
+        id=1, name="Acme", normalized_name="acme", enrichment_status="pending"
+    )
     db_session.add(company)
-    await db_session.flush()
 
     vacancy = Vacancy(
         external_id="v1",
@@ -48,7 +41,6 @@ async def test_orchestrate_both_passes(db_session):
         extraction_status="pending",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     mock_llm_run = MagicMock(spec=EnrichmentRun)
     mock_llm_run.status = "completed"
@@ -58,28 +50,14 @@ async def test_orchestrate_both_passes(db_session):
     mock_ext_run.status = "completed"
     mock_ext_run.items_succeeded = 1
 
+    # The orchestrator and its services belong to this test, so the stubs can
+    # be assigned directly instead of patched in and out.
     orchestrator = EnrichmentOrchestrator(db=db_session)
+    orchestrator._extraction_service.run_llm_extraction = returning(mock_llm_run)
+    orchestrator._update_company_quality_scores = returning()
+    orchestrator._external_service.run_external_enrichment = returning(mock_ext_run)
 
-    with (
-        patch.object(
-            orchestrator._extraction_service,
-            "run_llm_extraction",
-            new_callable=AsyncMock,
-            return_value=mock_llm_run,
-        ),
-        patch.object(
-            orchestrator,
-            "_update_company_quality_scores",
-            new_callable=AsyncMock,
-        ),
-        patch.object(
-            orchestrator._external_service,
-            "run_external_enrichment",
-            new_callable=AsyncMock,
-            return_value=mock_ext_run,
-        ),
-    ):
-        result = await orchestrator.run_full_enrichment(profile_id=profile.id)
+    result = await orchestrator.run_full_enrichment(profile_id=profile.id)
 
     assert result["llm_run"].status == "completed"
     assert result["external_run"].status == "completed"
@@ -87,9 +65,8 @@ async def test_orchestrate_both_passes(db_session):
 
 @pytest.mark.asyncio
 async def test_orchestrate_llm_only(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     db_session.add(profile)
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -99,22 +76,16 @@ async def test_orchestrate_llm_only(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
     mock_llm_run = MagicMock(spec=EnrichmentRun)
     mock_llm_run.status = "completed"
 
     orchestrator = EnrichmentOrchestrator(db=db_session)
+    orchestrator._extraction_service.run_llm_extraction = returning(mock_llm_run)
 
-    with patch.object(
-        orchestrator._extraction_service,
-        "run_llm_extraction",
-        new_callable=AsyncMock,
-        return_value=mock_llm_run,
-    ):
-        result = await orchestrator.run_full_enrichment(
-            profile_id=profile.id, pass_type="llm"
-        )
+    result = await orchestrator.run_full_enrichment(
+        profile_id=profile.id, pass_type="llm"
+    )
 
     assert result["llm_run"].status == "completed"
     assert result.get("external_run") is None
@@ -122,13 +93,13 @@ async def test_orchestrate_llm_only(db_session):
 
 @pytest.mark.asyncio
 async def test_update_company_quality_scores(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     db_session.add(profile)
-    await db_session.flush()
 
-    company = Company(name="Acme", normalized_name="acme", enrichment_status="pending")
+    company = Company(
+        id=1, name="Acme", normalized_name="acme", enrichment_status="pending"
+    )
     db_session.add(company)
-    await db_session.flush()
 
     # Two vacancies for same company -- one good extraction, one partial
     v1 = Vacancy(
@@ -154,7 +125,6 @@ async def test_update_company_quality_scores(db_session):
         extracted_data={"erp": None, "team": "3"},
     )
     db_session.add_all([v1, v2])
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -164,11 +134,10 @@ async def test_update_company_quality_scores(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
     orchestrator = EnrichmentOrchestrator(db=db_session)
     await orchestrator._update_company_quality_scores(profile_id=profile.id)
 
-    await db_session.refresh(company)
+    await db_session.refresh(company, attribute_names=["extraction_quality"])
     # v1 quality: 2/2 = 1.0, v2 quality: 1/2 = 0.5, average = 0.75
     assert company.extraction_quality == 0.75
@@ -9,6 +9,7 @@ from app.models.company import Company
 from app.models.profile import SearchProfile
 from app.models.vacancy import Vacancy
 from app.services.external_enrichment import ExternalEnrichmentService
+from tests.helpers import returning
 
 
 @pytest.mark.asyncio
@@ -38,7 +39,6 @@ async def test_enrich_qualifying_companies(db_session):
         extracted_data={"erp_systems": ["SAP"]},
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     mock_kvk = KvKCompanyData(
         kvk_number="12345678",
@@ -71,10 +71,10 @@ async def test_enrich_qualifying_companies(db_session):
         patch.object(service, "_openkvk_client", create=True) as mock_openkvk_client,
         patch.object(service, "_apollo_client", create=True) as mock_apollo_client,
     ):
-        mock_kvk_client.find_kvk_number = AsyncMock(return_value="12345678")
-        mock_kvk_client.get_company_profile = AsyncMock(return_value=mock_kvk)
-        mock_openkvk_client.get_company = AsyncMock(return_value=mock_openkvk)
-        mock_apollo_client.enrich_company = AsyncMock(return_value=mock_apollo)
+        mock_kvk_client.find_kvk_number = returning("12345678")
+        mock_kvk_client.get_company_profile = returning(mock_kvk)
+        mock_openkvk_client.get_company = returning(mock_openkvk)
+        mock_apollo_client.enrich_company = returning(mock_apollo)
 
         run = await service.run_external_enrichment(profile_id=profile.id)
 
@@ -82,7 +82,18 @@ async def test_enrich_qualifying_companies(db_session):
     assert run.items_processed == 1
     assert run.items_succeeded == 1
 
-    await db_session.refresh(company)
+    await db_session.refresh(
+        company,
+        attribute_names=[
+            "kvk_number",
+            "sbi_codes",
+            "employee_range",
+            "entity_count",
+            "enrichment_status",
+            "enriched_at",
+            "enrichment_data",
+        ],
+    )
     assert company.kvk_number == "12345678"
     # Paid KvK API overrides SBI codes from OpenKVK
     assert company.sbi_codes == [{"code": "6201", "description": "Software"}]
@@ -123,7 +134,6 @@ async def test_skip_companies_below_threshold(db_session):
         extraction_status="completed",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     service = ExternalEnrichmentService(db=db_session)
     run = await service.run_external_enrichment(profile_id=profile.id)
@@ -157,7 +167,6 @@ async def test_skip_already_enriched_companies(db_session):
         extraction_status="completed",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     service = ExternalEnrichmentService(db=db_session)
     run = await service.run_external_enrichment(profile_id=profile.id)
@@ -191,7 +200,6 @@ async def test_enrich_handles_kvk_failure(db_session):
         extraction_status="completed",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     service = ExternalEnrichmentService(db=db_session)
     with (
@@ -199,9 +207,10 @@ async def test_enrich_handles_kvk_failure(db_session):
         patch.object(service, "_openkvk_client", create=True) as mock_openkvk_client,
         patch.object(service, "_apollo_client", create=True) as mock_apollo_client,
     ):
-        mock_kvk_client.find_kvk_number = AsyncMock(return_value=None)
+        mock_kvk_client.find_kvk_number = returning(None)
+        # AsyncMock only where the test asserts on the calls
         mock_openkvk_client.get_company = AsyncMock(return_value=None)
-        mock_apollo_client.enrich_company = AsyncMock(return_value=None)
+        mock_apollo_client.enrich_company = returning(None)
 
         run = await service.run_external_enrichment(profile_id=profile.id)
 
@@ -211,5 +220,5 @@ async def test_enrich_handles_kvk_failure(db_session):
     # OpenKVK should not have been called (no KvK number found)
     mock_openkvk_client.get_company.assert_not_called()
     # Company is enriched with whatever we got (nothing in this case)
-    await db_session.refresh(company)
+    await db_session.refresh(company, attribute_names=["enrichment_status"])
     assert company.enrichment_status == "completed"
@@ -1,8 +1,6 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.compiler import compiles
 
 from app.integrations.claude_llm import ExtractionResult
 from app.models.company import Company
@@ -12,12 +10,6 @@ from app.models.vacancy import Vacancy
 from app.services.extraction import ExtractionService, compute_extraction_quality
 
 
-# SQLite doesn't support JSONB
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
-
-
 def test_compute_extraction_quality_all_fields():
     schema = {
         "erp_systems": "ERP?",
@@ -61,6 +53,7 @@ def test_compute_extraction_quality_empty():
 async def test_extract_vacancies_for_profile(db_session):
     # Set up profile with extraction prompt
     profile = SearchProfile(
+        id=1,
         name="AP",
         slug="ap",
         search_terms=[
@@ -68,7 +61,6 @@ async def test_extract_vacancies_for_profile(db_session):
         ],
     )
     db_session.add(profile)
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -81,12 +73,10 @@ async def test_extract_vacancies_for_profile(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
     # Add a company and vacancies
-    company = Company(name="Acme B.V.", normalized_name="acme")
+    company = Company(id=1, name="Acme B.V.", normalized_name="acme")
     db_session.add(company)
-    await db_session.flush()
 
     vacancy = Vacancy(
         external_id="v1",
@@ -99,7 +89,6 @@ async def test_extract_vacancies_for_profile(db_session):
         extraction_status="pending",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     mock_result = ExtractionResult(
         extracted_data={"erp_systems": ["SAP"], "team_size": "5"},
@@ -122,7 +111,9 @@ async def test_extract_vacancies_for_profile(db_session):
     assert run.tokens_output == 100
 
     # Verify vacancy was updated
-    await db_session.refresh(vacancy)
+    await db_session.refresh(
+        vacancy, attribute_names=["extraction_status", "extracted_data"]
+    )
     assert vacancy.extraction_status == "completed"
     assert vacancy.extracted_data is not None
     assert "SAP" in vacancy.extracted_data["erp_systems"]
@@ -130,9 +121,8 @@ async def test_extract_vacancies_for_profile(db_session):
 
 @pytest.mark.asyncio
 async def test_extract_skips_already_extracted(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     db_session.add(profile)
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -142,11 +132,9 @@ async def test_extract_skips_already_extracted(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
-    company = Company(name="Acme", normalized_name="acme")
+    company = Company(id=1, name="Acme", normalized_name="acme")
     db_session.add(company)
-    await db_session.flush()
 
     # Already extracted vacancy
     vacancy = Vacancy(
@@ -161,7 +149,6 @@ async def test_extract_skips_already_extracted(db_session):
         extracted_data={"erp": ["SAP"]},
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     service = ExtractionService(db=db_session)
     run = await service.run_llm_extraction(profile_id=profile.id)
@@ -171,9 +158,8 @@ async def test_extract_skips_already_extracted(db_session):
 
 @pytest.mark.asyncio
 async def test_extract_handles_llm_failure(db_session):
-    profile = SearchProfile(name="AP", slug="ap", search_terms=[])
+    profile = SearchProfile(id=1, name="AP", slug="ap", search_terms=[])
     db_session.add(profile)
-    await db_session.flush()
 
     prompt = ExtractionPrompt(
         profile_id=profile.id,
@@ -183,11 +169,9 @@ async def test_extract_handles_llm_failure(db_session):
         is_active=True,
     )
     db_session.add(prompt)
-    await db_session.flush()
 
-    company = Company(name="Acme", normalized_name="acme")
+    company = Company(id=1, name="Acme", normalized_name="acme")
     db_session.add(company)
-    await db_session.flush()
 
     vacancy = Vacancy(
         external_id="v1",
@@ -200,7 +184,6 @@ async def test_extract_handles_llm_failure(db_session):
         extraction_status="pending",
     )
     db_session.add(vacancy)
-    await db_session.flush()
 
     mock_result = ExtractionResult(
         success=False,
@@ -216,5 +199,5 @@ async def test_extract_handles_llm_failure(db_session):
     assert run.items_processed == 1
     assert run.items_failed == 1
 
-    await db_session.refresh(vacancy)
+    await db_session.refresh(vacancy, attribute_names=["extraction_status"])
     assert vacancy.extraction_status == "failed"
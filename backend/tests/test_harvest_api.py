@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -5,28 +6,31 @@ from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
-async def test_trigger_harvest(client: AsyncClient):
-    # Create a profile first
-    await client.post(
-        "/api/profiles",
-        json={
-            "name": "AP",
-            "slug": "ap",
-            "search_terms": [
-                {
-                    "term": "accounts payable",
-                    "language": "en",
-                    "priority": "primary",
-                },
-            ],
-        },
+async def test_trigger_harvest(client: AsyncClient, seed_profiles):
+    await seed_profiles(
+        [
+            {
+                "id": 1,
+                "name": "AP",
+                "slug": "ap",
+                "search_terms": [
+                    {
+                        "term": "accounts payable",
+                        "language": "en",
+                        "priority": "primary",
+                    },
+                ],
+            }
+        ]
     )
 
     with (
         patch("app.worker.has_celery_workers", return_value=True),
-        patch("app.worker.trigger_harvest_task") as mock_task,
+        patch("app.worker.harvest_and_enrich") as mock_chain,
     ):
-        mock_task.delay = lambda *a, **kw: type("obj", (), {"id": "test-task-id"})()
+        mock_chain.return_value.apply_async.return_value = SimpleNamespace(
+            id="enrich-task-id", parent=SimpleNamespace(id="test-task-id")
+        )
         response = await client.post(
             "/api/harvest/trigger",
             json={"profile_id": 1, "source": "google_jobs"},
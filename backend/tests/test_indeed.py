@@ -1,14 +1,5 @@
-import pytest
-
 from app.scrapers.indeed import IndeedResult, IndeedScraper
 
-
-@pytest.fixture(autouse=True)
-def setup_db():
-    """Override the conftest autouse fixture — these tests need no database."""
-    yield
-
-
 MOCK_INDEED_HTML = """
 <html><body>
 <div class="job_seen_beacon">
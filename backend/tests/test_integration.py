@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.company import Company
 from app.models.vacancy import Vacancy
 from app.scrapers.serpapi import SerpApiResult
+from app.services.harvester import HarvestService
 
 MOCK_RESULTS = [
     SerpApiResult(
@@ -74,8 +75,6 @@ async def test_full_pipeline(client: AsyncClient, db_session: AsyncSession):
     assert response.json()["slug"] == "ap"
 
     # 3. Run harvest directly (bypass Celery for integration test)
-    from app.services.harvester import HarvestService
-
     service = HarvestService(db=db_session)
     with patch.object(
         service,
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -125,44 +125,43 @@ async def test_get_company_handles_exception():
     assert result is None
 
 
+FETCH_URL = "https://opendata.kvk.nl/api/v1/hvds/basisbedrijfsgegevens/12345678"
+
+
+@pytest.fixture
+def mock_httpx_client(monkeypatch):
+    """Stand-in for the AsyncClient that OpenKvKClient._fetch opens per attempt."""
+    client = AsyncMock()
+    client_cls = MagicMock()
+    client_cls.return_value.__aenter__ = AsyncMock(return_value=client)
+    client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr("app.integrations.openkvk.httpx.AsyncClient", client_cls)
+    return client
+
+
 @pytest.mark.asyncio
-async def test_fetch_returns_json_on_success():
-    url = "https://opendata.kvk.nl/api/v1/hvds/basisbedrijfsgegevens/12345678"
-    mock_response = httpx.Response(
-        200, json=MOCK_OPENKVK_RESPONSE, request=httpx.Request("GET", url)
+async def test_fetch_returns_json_on_success(mock_httpx_client):
+    mock_httpx_client.get.return_value = httpx.Response(
+        200, json=MOCK_OPENKVK_RESPONSE, request=httpx.Request("GET", FETCH_URL)
     )
 
-    with patch("app.integrations.openkvk.httpx.AsyncClient") as mock_cls:
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        result = await OpenKvKClient._fetch("12345678")
+    result = await OpenKvKClient._fetch("12345678")
 
     assert result == MOCK_OPENKVK_RESPONSE
-    mock_client.get.assert_called_once_with(
-        "https://opendata.kvk.nl/api/v1/hvds/basisbedrijfsgegevens/12345678"
-    )
+    mock_httpx_client.get.assert_called_once_with(FETCH_URL)
 
 
 @pytest.mark.asyncio
-async def test_fetch_returns_none_on_404():
-    mock_response = httpx.Response(404)
+async def test_fetch_returns_none_on_404(mock_httpx_client):
+    mock_httpx_client.get.return_value = httpx.Response(404)
 
-    with patch("app.integrations.openkvk.httpx.AsyncClient") as mock_cls:
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        result = await OpenKvKClient._fetch("99999999")
+    result = await OpenKvKClient._fetch("99999999")
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_fetch_retries_on_server_error():
+async def test_fetch_retries_on_server_error(mock_httpx_client):
     error_response = httpx.Response(500)
     call_count = 0
 
@@ -179,15 +178,8 @@ async def test_fetch_retries_on_server_error():
             200, json=MOCK_OPENKVK_RESPONSE, request=httpx.Request("GET", url)
         )
 
-    with (
-        patch("app.integrations.openkvk.httpx.AsyncClient") as mock_cls,
-        patch("app.integrations.openkvk.asyncio.sleep", new_callable=AsyncMock),
-    ):
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = mock_get
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    mock_httpx_client.get.side_effect = mock_get
+    with patch("app.integrations.openkvk.asyncio.sleep", new_callable=AsyncMock):
         result = await OpenKvKClient._fetch("12345678")
 
     assert result == MOCK_OPENKVK_RESPONSE
@@ -195,46 +187,34 @@ async def test_fetch_retries_on_server_error():
 
 
 @pytest.mark.asyncio
-async def test_fetch_no_retry_on_client_error():
+async def test_fetch_no_retry_on_client_error(mock_httpx_client):
     """4xx errors (except 404) should raise immediately, not retry."""
-    error_response = httpx.Response(403)
-
-    with patch("app.integrations.openkvk.httpx.AsyncClient") as mock_cls:
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Forbidden",
-            request=httpx.Request("GET", "https://opendata.kvk.nl/api/v1/hvds/basisbedrijfsgegevens/12345678"),
-            response=error_response,
-        )
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
+        "Forbidden",
+        request=httpx.Request("GET", FETCH_URL),
+        response=httpx.Response(403),
+    )
 
-        with pytest.raises(httpx.HTTPStatusError):
-            await OpenKvKClient._fetch("12345678")
+    with pytest.raises(httpx.HTTPStatusError):
+        await OpenKvKClient._fetch("12345678")
 
     # Should have been called only once — no retry on 403
-    assert mock_client.get.call_count == 1
+    assert mock_httpx_client.get.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_fetch_raises_after_max_retries():
+async def test_fetch_raises_after_max_retries(mock_httpx_client):
     """After 3 failed attempts on server errors, the exception should propagate."""
-    error_response = httpx.Response(502)
+    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
+        "Bad Gateway",
+        request=httpx.Request("GET", FETCH_URL),
+        response=httpx.Response(502),
+    )
 
     with (
-        patch("app.integrations.openkvk.httpx.AsyncClient") as mock_cls,
         patch("app.integrations.openkvk.asyncio.sleep", new_callable=AsyncMock),
+        pytest.raises(httpx.HTTPStatusError),
     ):
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Bad Gateway",
-            request=httpx.Request("GET", "https://opendata.kvk.nl/api/v1/hvds/basisbedrijfsgegevens/12345678"),
-            response=error_response,
-        )
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        with pytest.raises(httpx.HTTPStatusError):
-            await OpenKvKClient._fetch("12345678")
+        await OpenKvKClient._fetch("12345678")
 
-    assert mock_client.get.call_count == 3
+    assert mock_httpx_client.get.call_count == 3
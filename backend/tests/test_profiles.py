@@ -32,15 +32,8 @@ async def test_create_profile(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_list_profiles(client: AsyncClient):
-    await client.post(
-        "/api/profiles",
-        json={"name": "AP", "slug": "ap", "search_terms": []},
-    )
-    await client.post(
-        "/api/profiles",
-        json={"name": "HR", "slug": "hr", "search_terms": []},
-    )
+async def test_list_profiles(client: AsyncClient, seed_profiles):
+    await seed_profiles([{"name": "AP", "slug": "ap"}, {"name": "HR", "slug": "hr"}])
     response = await client.get("/api/profiles")
     assert response.status_code == 200
     data = response.json()
@@ -48,13 +41,9 @@ async def test_list_profiles(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_profile(client: AsyncClient):
-    create = await client.post(
-        "/api/profiles",
-        json={"name": "AP", "slug": "ap", "search_terms": []},
-    )
-    profile_id = create.json()["id"]
-    response = await client.get(f"/api/profiles/{profile_id}")
+async def test_get_profile(client: AsyncClient, seed_profiles):
+    [profile] = await seed_profiles([{"name": "AP", "slug": "ap"}])
+    response = await client.get(f"/api/profiles/{profile.id}")
     assert response.status_code == 200
     assert response.json()["slug"] == "ap"
 
@@ -66,14 +55,10 @@ async def test_get_profile_not_found(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_update_profile(client: AsyncClient):
-    create = await client.post(
-        "/api/profiles",
-        json={"name": "AP", "slug": "ap", "search_terms": []},
-    )
-    profile_id = create.json()["id"]
+async def test_update_profile(client: AsyncClient, seed_profiles):
+    [profile] = await seed_profiles([{"name": "AP", "slug": "ap"}])
     response = await client.put(
-        f"/api/profiles/{profile_id}",
+        f"/api/profiles/{profile.id}",
         json={
             "name": "Accounts Payable",
             "description": "Updated description",
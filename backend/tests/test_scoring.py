@@ -1,8 +1,8 @@
 from datetime import UTC, datetime, timedelta
+from unittest.mock import ANY
 
 import pytest
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.compiler import compiles
+from sqlalchemy import func, select
 
 from app.models.company import Company
 from app.models.lead import Lead, ScoringConfig
@@ -14,34 +14,33 @@ from app.services.scoring import (
     ScoringService,
 )
 
-
-# SQLite doesn't support JSONB — compile it as JSON for tests
-@compiles(JSONB, "sqlite")
-def compile_jsonb_sqlite(type_, compiler, **kw):
-    return "JSON"
-
+# One reference time for the whole module; the scoring logic only looks at
+# whole days, so tests don't need a fresh clock reading each.
+_NOW = datetime.now(UTC)
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Builders return unsaved objects with explicit primary keys, so each test adds
+# its whole setup with one add_all + flush.
+
 
-async def _create_profile(db_session) -> SearchProfile:
-    profile = SearchProfile(name="Accounts Payable", slug="ap")
-    db_session.add(profile)
-    await db_session.flush()
-    return profile
+def _make_profile() -> SearchProfile:
+    return SearchProfile(id=1, name="Accounts Payable", slug="ap")
 
 
-async def _create_company(
-    db_session,
+def _make_company(
+    *,
+    id: int = 1,
     name: str = "Acme B.V.",
     employee_range: str | None = "200-499",
     entity_count: int | None = 5,
     revenue_range: str | None = "10M-50M",
     sbi_codes: list | None = None,
 ) -> Company:
-    company = Company(
+    return Company(
+        id=id,
         name=name,
         normalized_name=name.lower().replace(" ", ""),
         employee_range=employee_range,
@@ -49,13 +48,9 @@ async def _create_company(
         revenue_range=revenue_range,
         sbi_codes=sbi_codes or ["6201"],
     )
-    db_session.add(company)
-    await db_session.flush()
-    return company
 
 
-async def _create_vacancy(
-    db_session,
+def _make_vacancy(
     profile_id: int,
     company_id: int,
     *,
@@ -66,8 +61,7 @@ async def _create_vacancy(
     extracted_data: dict | None = None,
     status: str = "active",
 ) -> Vacancy:
-    now = datetime.now(UTC)
-    vacancy = Vacancy(
+    return Vacancy(
         external_id=f"v-{company_id}-{source}-{job_title.replace(' ', '-')}",
         source=source,
         search_profile_id=profile_id,
@@ -75,220 +69,109 @@ async def _create_vacancy(
         company_name_raw="Acme B.V.",
         job_title=job_title,
         raw_text="Vacancy text placeholder",
-        first_seen_at=first_seen_at or now,
-        last_seen_at=last_seen_at or now,
+        first_seen_at=first_seen_at or _NOW,
+        last_seen_at=last_seen_at or _NOW,
         extracted_data=extracted_data,
         status=status,
     )
-    db_session.add(vacancy)
-    await db_session.flush()
-    return vacancy
-
-
-# ---------------------------------------------------------------------------
-# Fit score tests
-# ---------------------------------------------------------------------------
-
 
-class TestComputeFitScore:
-    """Tests for the fit scoring logic."""
 
-    def test_employee_count_scoring(self, db_session):
-        """Large companies score higher on employee_count."""
-        service = ScoringService(db=db_session)
-        company = Company(
-            id=1,
-            name="Big Corp",
-            normalized_name="bigcorp",
-            employee_range="200-499",
+async def _fetch_lead(db_session, company_id: int, profile_id: int) -> Lead:
+    result = await db_session.execute(
+        select(Lead).where(
+            Lead.company_id == company_id,
+            Lead.search_profile_id == profile_id,
         )
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Big Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data=None,
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["employee_count"]["score"] == 80
-        assert result["breakdown"]["employee_count"]["value"] == "200-499"
+    )
+    return result.scalar_one()
 
-    def test_entity_count_scoring(self, db_session):
-        """Companies with multiple entities score higher."""
-        service = ScoringService(db=db_session)
-        company = Company(
-            id=1,
-            name="Multi Entity Corp",
-            normalized_name="multientitycorp",
-            entity_count=5,
-        )
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Multi Entity Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data=None,
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["entity_count"]["score"] == 50
-        assert result["breakdown"]["entity_count"]["value"] == 5
 
-    def test_erp_compatibility_from_extracted_data(self, db_session):
-        """ERP systems extracted from vacancies affect fit score."""
-        service = ScoringService(db=db_session)
-        company = Company(id=1, name="SAP Corp", normalized_name="sapcorp")
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="SAP Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"erp_systems": ["SAP S/4HANA"]},
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["erp_compatibility"]["score"] == 90
-        assert result["breakdown"]["erp_compatibility"]["value"] == "SAP S/4HANA"
+@pytest.fixture
+def service() -> ScoringService:
+    # The fit and timing computations are pure; they never touch the session.
+    return ScoringService(db=None)
 
-    def test_erp_unknown_gets_moderate_score(self, db_session):
-        """No ERP data should yield a moderate score, not zero."""
-        service = ScoringService(db=db_session)
-        company = Company(id=1, name="Unknown ERP", normalized_name="unknownerp")
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Unknown ERP",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={},
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["erp_compatibility"]["score"] == 40
 
-    def test_no_existing_automation_confirmed_none(self, db_session):
-        """Companies with no existing automation score high on that criterion."""
-        service = ScoringService(db=db_session)
-        company = Company(id=1, name="Manual Corp", normalized_name="manualcorp")
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Manual Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"automation_status": "No automation, manual process"},
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["no_existing_automation"]["score"] == 90
-        automation = result["breakdown"]["no_existing_automation"]
-        assert automation["value"] == "confirmed_none"
+# ---------------------------------------------------------------------------
+# Fit score tests
+# ---------------------------------------------------------------------------
 
-    def test_has_existing_automation_low_score(self, db_session):
-        """Companies with existing P2P tools score low (not a good lead)."""
-        service = ScoringService(db=db_session)
-        company = Company(id=1, name="Automated Corp", normalized_name="automatedcorp")
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Automated Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"automation_status": "Using Basware for P2P"},
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["no_existing_automation"]["score"] == 10
-        assert result["breakdown"]["no_existing_automation"]["value"] == "has_tool"
 
-    def test_sector_fit_matching_sbi(self, db_session):
-        """Companies in preferred sectors score higher."""
-        service = ScoringService(db=db_session)
-        company = Company(
-            id=1,
-            name="IT Corp",
-            normalized_name="itcorp",
-            sbi_codes=["6201"],
-        )
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="IT Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data=None,
-            )
-        ]
-        result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["sector_fit"]["score"] == 80
-        assert result["breakdown"]["sector_fit"]["value"] == "6201"
+class TestComputeFitScore:
+    """Tests for the fit scoring logic."""
 
-    def test_multi_language_from_extraction(self, db_session):
-        """International complexity signals boost multi_language criterion."""
-        service = ScoringService(db=db_session)
-        company = Company(id=1, name="Global Corp", normalized_name="globalcorp")
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Global Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={
-                    "complexity_signals": "International operations, English and German"
-                },
-            )
-        ]
+    @pytest.mark.parametrize(
+        ("company_kwargs", "extracted_data", "criterion", "score", "value"),
+        [
+            # Large companies score higher on employee_count
+            pytest.param(
+                {"employee_range": "200-499"},
+                None,
+                "employee_count",
+                80,
+                "200-499",
+                id="employee_count",
+            ),
+            # Companies with multiple entities score higher
+            pytest.param(
+                {"entity_count": 5}, None, "entity_count", 50, 5, id="entity_count"
+            ),
+            # ERP systems extracted from vacancies affect fit score
+            pytest.param(
+                {},
+                {"erp_systems": ["SAP S/4HANA"]},
+                "erp_compatibility",
+                90,
+                "SAP S/4HANA",
+                id="erp_from_extracted_data",
+            ),
+            # No ERP data should yield a moderate score, not zero
+            pytest.param({}, {}, "erp_compatibility", 40, ANY, id="erp_unknown"),
+            # Companies with no existing automation score high on that criterion
+            pytest.param(
+                {},
+                {"automation_status": "No automation, manual process"},
+                "no_existing_automation",
+                90,
+                "confirmed_none",
+                id="no_existing_automation",
+            ),
+            # Companies with existing P2P tools score low (not a good lead)
+            pytest.param(
+                {},
+                {"automation_status": "Using Basware for P2P"},
+                "no_existing_automation",
+                10,
+                "has_tool",
+                id="has_existing_automation",
+            ),
+            # Companies in preferred sectors score higher
+            pytest.param(
+                {"sbi_codes": ["6201"]}, None, "sector_fit", 80, "6201", id="sector_fit"
+            ),
+            # International complexity signals boost multi_language criterion
+            pytest.param(
+                {},
+                {"complexity_signals": "International operations, English and German"},
+                "multi_language",
+                80,
+                "multi",
+                id="multi_language",
+            ),
+        ],
+    )
+    def test_criterion_scoring(
+        self, service, company_kwargs, extracted_data, criterion, score, value
+    ):
+        """Each fit criterion scores the company/vacancy signal it looks at."""
+        company = Company(id=1, name="Acme", normalized_name="acme", **company_kwargs)
+        vacancies = [_make_vacancy(1, 1, extracted_data=extracted_data)]
         result = service._compute_fit_score(company, vacancies, DEFAULT_FIT_CRITERIA)
-        assert result["breakdown"]["multi_language"]["score"] == 80
-        assert result["breakdown"]["multi_language"]["value"] == "multi"
+        assert result["breakdown"][criterion]["score"] == score
+        assert result["breakdown"][criterion]["value"] == value
 
-    def test_fit_score_in_valid_range(self, db_session):
+    def test_fit_score_in_valid_range(self, service):
         """Fit score must be between 0 and 100."""
-        service = ScoringService(db=db_session)
         company = Company(
             id=1,
             name="Max Corp",
@@ -299,16 +182,9 @@ class TestComputeFitScore:
             sbi_codes=["6201"],
         )
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Max Corp",
-                job_title="AP Medewerker",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
+            _make_vacancy(
+                1,
+                1,
                 extracted_data={
                     "erp_systems": ["SAP"],
                     "automation_status": "No automation",
@@ -328,200 +204,74 @@ class TestComputeFitScore:
 class TestComputeTimingScore:
     """Tests for the timing scoring logic."""
 
-    def test_old_vacancy_scores_points(self, db_session):
+    def test_old_vacancy_scores_points(self, service):
         """Vacancy open for >60 days earns timing points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now - timedelta(days=90),
-                last_seen_at=now,
-                status="active",
-            )
-        ]
+        vacancies = [_make_vacancy(1, 1, first_seen_at=_NOW - timedelta(days=90))]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["vacancy_age_over_60_days"]["points"] == 3
         assert "90 days" in result["breakdown"]["vacancy_age_over_60_days"]["value"]
 
-    def test_recent_vacancy_no_age_points(self, db_session):
+    def test_recent_vacancy_no_age_points(self, service):
         """Vacancy open for <60 days gets zero age points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now - timedelta(days=30),
-                last_seen_at=now,
-                status="active",
-            )
-        ]
+        vacancies = [_make_vacancy(1, 1, first_seen_at=_NOW - timedelta(days=30))]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["vacancy_age_over_60_days"]["points"] == 0
 
-    def test_multiple_vacancies_scores_points(self, db_session):
+    def test_multiple_vacancies_scores_points(self, service):
         """Two or more vacancies for same role earn points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=i,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now,
-                last_seen_at=now,
-                status="active",
-            )
-            for i in range(1, 4)
-        ]
+        vacancies = [_make_vacancy(1, 1) for _ in range(3)]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["multiple_vacancies_same_role"]["points"] == 4
         assert result["breakdown"]["multiple_vacancies_same_role"]["value"] == 3
 
-    def test_multi_platform_scores_points(self, db_session):
+    def test_multi_platform_scores_points(self, service):
         """Posting on multiple platforms earns timing points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now,
-                last_seen_at=now,
-                status="active",
-            ),
-            Vacancy(
-                id=2,
-                source="indeed",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now,
-                last_seen_at=now,
-                status="active",
-            ),
+            _make_vacancy(1, 1),
+            _make_vacancy(1, 1, source="indeed"),
         ]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["multi_platform"]["points"] == 2
 
-    def test_management_vacancy_scores_points(self, db_session):
+    def test_management_vacancy_scores_points(self, service):
         """Management-level job titles earn timing points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="Manager Accounts Payable",
-                first_seen_at=now,
-                last_seen_at=now,
-                status="active",
-            )
-        ]
+        vacancies = [_make_vacancy(1, 1, job_title="Manager Accounts Payable")]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["management_vacancy"]["points"] == 2
 
-    def test_repeated_publication_scores_points(self, db_session):
+    def test_repeated_publication_scores_points(self, service):
         """Vacancy seen over >14 day span earns repeated publication points."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now - timedelta(days=20),
-                last_seen_at=now,
-                status="active",
-            )
-        ]
+        vacancies = [_make_vacancy(1, 1, first_seen_at=_NOW - timedelta(days=20))]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["breakdown"]["repeated_publication"]["points"] == 3
 
-    def test_max_timing_score_all_signals(self, db_session):
+    def test_max_timing_score_all_signals(self, service):
         """All timing signals present should yield 100."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
+            _make_vacancy(
+                1,
+                1,
                 job_title="Manager Accounts Payable",
-                first_seen_at=now - timedelta(days=90),
-                last_seen_at=now,
-                status="active",
+                first_seen_at=_NOW - timedelta(days=90),
             ),
-            Vacancy(
-                id=2,
+            _make_vacancy(
+                1,
+                1,
                 source="indeed",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
                 job_title="Senior AP Medewerker",
-                first_seen_at=now - timedelta(days=90),
-                last_seen_at=now,
-                status="active",
+                first_seen_at=_NOW - timedelta(days=90),
             ),
-            Vacancy(
-                id=3,
-                source="linkedin",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now - timedelta(days=90),
-                last_seen_at=now,
-                status="active",
+            _make_vacancy(
+                1, 1, source="linkedin", first_seen_at=_NOW - timedelta(days=90)
             ),
         ]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert result["score"] == 100.0
         assert result["total_points"] == result["max_points"]
 
-    def test_timing_score_in_valid_range(self, db_session):
+    def test_timing_score_in_valid_range(self, service):
         """Timing score must be between 0 and 100."""
-        service = ScoringService(db=db_session)
-        now = datetime.now(UTC)
-        vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP Medewerker",
-                first_seen_at=now,
-                last_seen_at=now,
-                status="active",
-            )
-        ]
+        vacancies = [_make_vacancy(1, 1)]
         result = service._compute_timing_score(vacancies, DEFAULT_TIMING_SIGNALS)
         assert 0 <= result["score"] <= 100
 
@@ -537,48 +287,49 @@ class TestCompositeScoring:
     @pytest.mark.asyncio
     async def test_composite_score_and_hot_status(self, db_session):
         """High-scoring company should be classified as 'hot'."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(
-            db_session,
+        profile = _make_profile()
+        company = _make_company(
             employee_range="1000+",
             entity_count=25,
             revenue_range="500M+",
             sbi_codes=["6201"],
         )
-        now = datetime.now(UTC)
         # Create signals that push both fit and timing high
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            job_title="Manager Accounts Payable",
-            source="google_jobs",
-            first_seen_at=now - timedelta(days=90),
-            last_seen_at=now,
-            extracted_data={
-                "erp_systems": ["SAP"],
-                "automation_status": "No automation, manual process",
-                "complexity_signals": "International multi-language operations",
-            },
-        )
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            job_title="Senior AP Medewerker",
-            source="indeed",
-            first_seen_at=now - timedelta(days=90),
-            last_seen_at=now,
-            extracted_data={"erp_systems": ["SAP"]},
-        )
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            job_title="AP Medewerker",
-            source="linkedin",
-            first_seen_at=now - timedelta(days=90),
-            last_seen_at=now,
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    job_title="Manager Accounts Payable",
+                    source="google_jobs",
+                    first_seen_at=_NOW - timedelta(days=90),
+                    last_seen_at=_NOW,
+                    extracted_data={
+                        "erp_systems": ["SAP"],
+                        "automation_status": "No automation, manual process",
+                        "complexity_signals": "International multi-language operations",
+                    },
+                ),
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    job_title="Senior AP Medewerker",
+                    source="indeed",
+                    first_seen_at=_NOW - timedelta(days=90),
+                    last_seen_at=_NOW,
+                    extracted_data={"erp_systems": ["SAP"]},
+                ),
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    job_title="AP Medewerker",
+                    source="linkedin",
+                    first_seen_at=_NOW - timedelta(days=90),
+                    last_seen_at=_NOW,
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -591,21 +342,24 @@ class TestCompositeScoring:
     @pytest.mark.asyncio
     async def test_low_scoring_company_is_monitor(self, db_session):
         """Low-scoring company should be classified as 'monitor'."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(
-            db_session,
+        profile = _make_profile()
+        company = _make_company(
             employee_range="1-9",
             entity_count=1,
             revenue_range="<1M",
             sbi_codes=["0111"],  # non-matching sector
         )
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
-            extracted_data={"automation_status": "Using Basware for P2P"},
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                    extracted_data={"automation_status": "Using Basware for P2P"},
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -618,29 +372,25 @@ class TestCompositeScoring:
     @pytest.mark.asyncio
     async def test_composite_is_weighted_average(self, db_session):
         """Composite = fit * fit_weight + timing * timing_weight."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
         service = ScoringService(db=db_session)
         await service.score_profile(profile.id)
 
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Lead).where(
-                Lead.company_id == company.id,
-                Lead.search_profile_id == profile.id,
-            )
-        )
-        lead = result.scalar_one()
+        lead = await _fetch_lead(db_session, company.id, profile.id)
 
         expected_composite = round(lead.fit_score * 0.6 + lead.timing_score * 0.4, 1)
         assert lead.composite_score == expected_composite
@@ -657,14 +407,18 @@ class TestLeadUpsert:
     @pytest.mark.asyncio
     async def test_rescoring_updates_existing_lead(self, db_session):
         """Scoring the same company twice should update, not duplicate."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -672,8 +426,6 @@ class TestLeadUpsert:
         await service.score_profile(profile.id)
         await service.score_profile(profile.id)
 
-        from sqlalchemy import func, select
-
         result = await db_session.execute(
             select(func.count())
             .select_from(Lead)
@@ -688,14 +440,18 @@ class TestLeadUpsert:
     @pytest.mark.asyncio
     async def test_dismissed_status_preserved(self, db_session):
         """Dismissed leads should keep their status after rescoring."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -703,22 +459,14 @@ class TestLeadUpsert:
         await service.score_profile(profile.id)
 
         # Manually dismiss the lead
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Lead).where(
-                Lead.company_id == company.id,
-                Lead.search_profile_id == profile.id,
-            )
-        )
-        lead = result.scalar_one()
+        lead = await _fetch_lead(db_session, company.id, profile.id)
         lead.status = "dismissed"
         await db_session.flush()
 
         # Re-score — status should remain dismissed
         await service.score_profile(profile.id)
 
-        await db_session.refresh(lead)
+        await db_session.refresh(lead, attribute_names=["status", "scored_at"])
         assert lead.status == "dismissed"
         # But scores should still be updated
         assert lead.scored_at is not None
@@ -735,7 +483,10 @@ class TestScoringConfig:
     @pytest.mark.asyncio
     async def test_default_config_when_none_exists(self, db_session):
         """Without a ScoringConfig row, defaults should be used."""
-        profile = await _create_profile(db_session)
+        profile = _make_profile()
+        db_session.add(profile)
+        await db_session.flush()
+
         service = ScoringService(db=db_session)
         config = await service._get_scoring_config(profile.id)
 
@@ -748,7 +499,7 @@ class TestScoringConfig:
     @pytest.mark.asyncio
     async def test_custom_config_loaded(self, db_session):
         """Active ScoringConfig row should override defaults."""
-        profile = await _create_profile(db_session)
+        profile = _make_profile()
 
         custom_criteria = {
             "employee_count": {
@@ -766,7 +517,7 @@ class TestScoringConfig:
             timing_signals=DEFAULT_TIMING_SIGNALS,
             score_thresholds={"hot": 80, "warm": 60, "monitor": 30},
         )
-        db_session.add(scoring_config)
+        db_session.add_all([profile, scoring_config])
         await db_session.flush()
 
         service = ScoringService(db=db_session)
@@ -780,7 +531,7 @@ class TestScoringConfig:
     @pytest.mark.asyncio
     async def test_custom_thresholds_affect_status(self, db_session):
         """Custom score_thresholds should affect lead status classification."""
-        profile = await _create_profile(db_session)
+        profile = _make_profile()
 
         # Set very low thresholds so everything is "hot"
         scoring_config = ScoringConfig(
@@ -793,36 +544,30 @@ class TestScoringConfig:
             timing_signals=DEFAULT_TIMING_SIGNALS,
             score_thresholds={"hot": 5, "warm": 2, "monitor": 0},
         )
-        db_session.add(scoring_config)
-
-        company = await _create_company(
-            db_session,
+        company = _make_company(
             employee_range="1-9",
             entity_count=1,
             revenue_range="<1M",
             sbi_codes=["0111"],
         )
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
+        db_session.add_all(
+            [
+                profile,
+                scoring_config,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
         service = ScoringService(db=db_session)
         await service.score_profile(profile.id)
 
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Lead).where(
-                Lead.company_id == company.id,
-                Lead.search_profile_id == profile.id,
-            )
-        )
-        lead = result.scalar_one()
+        lead = await _fetch_lead(db_session, company.id, profile.id)
         # With threshold of 5, even a low-scoring company should be "hot"
         assert lead.status == "hot"
 
@@ -838,29 +583,9 @@ class TestAggregateExtractedData:
     def test_merge_list_fields_deduplicates(self):
         """List fields from multiple vacancies should be merged and deduplicated."""
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"erp_systems": ["SAP", "Oracle"]},
-            ),
-            Vacancy(
-                id=2,
-                source="indeed",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"erp_systems": ["SAP", "AFAS"]},
+            _make_vacancy(1, 1, extracted_data={"erp_systems": ["SAP", "Oracle"]}),
+            _make_vacancy(
+                1, 1, source="indeed", extracted_data={"erp_systems": ["SAP", "AFAS"]}
             ),
         ]
         result = ScoringService._aggregate_extracted_data(vacancies)
@@ -869,28 +594,11 @@ class TestAggregateExtractedData:
     def test_merge_string_keeps_longest(self):
         """String fields should keep the longest (most detailed) value."""
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"automation_status": "manual"},
-            ),
-            Vacancy(
-                id=2,
+            _make_vacancy(1, 1, extracted_data={"automation_status": "manual"}),
+            _make_vacancy(
+                1,
+                1,
                 source="indeed",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
                 extracted_data={
                     "automation_status": (
                         "No automation, fully manual invoice processing"
@@ -905,29 +613,9 @@ class TestAggregateExtractedData:
     def test_merge_skips_none_extracted_data(self):
         """Vacancies with no extracted_data should be skipped."""
         vacancies = [
-            Vacancy(
-                id=1,
-                source="google_jobs",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data=None,
-            ),
-            Vacancy(
-                id=2,
-                source="indeed",
-                search_profile_id=1,
-                company_id=1,
-                company_name_raw="Acme",
-                job_title="AP",
-                first_seen_at=datetime.now(UTC),
-                last_seen_at=datetime.now(UTC),
-                status="active",
-                extracted_data={"erp_systems": ["SAP"]},
+            _make_vacancy(1, 1, extracted_data=None),
+            _make_vacancy(
+                1, 1, source="indeed", extracted_data={"erp_systems": ["SAP"]}
             ),
         ]
         result = ScoringService._aggregate_extracted_data(vacancies)
@@ -945,7 +633,10 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_no_active_vacancies_returns_empty_stats(self, db_session):
         """Profile with no active vacancies should score zero companies."""
-        profile = await _create_profile(db_session)
+        profile = _make_profile()
+        db_session.add(profile)
+        await db_session.flush()
+
         service = ScoringService(db=db_session)
         stats = await service.score_profile(profile.id)
 
@@ -954,13 +645,18 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_inactive_vacancies_ignored(self, db_session):
         """Only active vacancies should be considered for scoring."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            status="filled",
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    status="filled",
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -971,38 +667,33 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_vacancy_stats_computed_correctly(self, db_session):
         """Lead should have correct vacancy stats."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            source="google_jobs",
-            first_seen_at=now - timedelta(days=45),
-        )
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            job_title="Senior AP Medewerker",
-            source="indeed",
-            first_seen_at=now - timedelta(days=10),
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    source="google_jobs",
+                    first_seen_at=_NOW - timedelta(days=45),
+                ),
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    job_title="Senior AP Medewerker",
+                    source="indeed",
+                    first_seen_at=_NOW - timedelta(days=10),
+                ),
+            ]
         )
         await db_session.flush()
 
         service = ScoringService(db=db_session)
         await service.score_profile(profile.id)
 
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Lead).where(
-                Lead.company_id == company.id,
-                Lead.search_profile_id == profile.id,
-            )
-        )
-        lead = result.scalar_one()
+        lead = await _fetch_lead(db_session, company.id, profile.id)
         assert lead.vacancy_count == 2
         assert lead.oldest_vacancy_days >= 45
         assert lead.platform_count == 2
@@ -1010,26 +701,30 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_multiple_companies_scored_independently(self, db_session):
         """Multiple companies for the same profile get separate leads."""
-        profile = await _create_profile(db_session)
-        company_a = await _create_company(db_session, name="Company A")
-        company_b = await _create_company(
-            db_session,
+        profile = _make_profile()
+        company_a = _make_company(name="Company A")
+        company_b = _make_company(
+            id=2,
             name="Company B",
             employee_range="1-9",
             entity_count=1,
         )
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company_a.id,
-            first_seen_at=now - timedelta(days=5),
-        )
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company_b.id,
-            first_seen_at=now - timedelta(days=5),
+        db_session.add_all(
+            [
+                profile,
+                company_a,
+                company_b,
+                _make_vacancy(
+                    profile.id,
+                    company_a.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+                _make_vacancy(
+                    profile.id,
+                    company_b.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
@@ -1038,8 +733,6 @@ class TestEdgeCases:
 
         assert stats["scored"] == 2
 
-        from sqlalchemy import func, select
-
         result = await db_session.execute(
             select(func.count())
             .select_from(Lead)
@@ -1053,29 +746,25 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_scoring_breakdown_has_all_keys(self, db_session):
         """Scoring breakdown should contain both fit and timing details."""
-        profile = await _create_profile(db_session)
-        company = await _create_company(db_session)
-        now = datetime.now(UTC)
-        await _create_vacancy(
-            db_session,
-            profile.id,
-            company.id,
-            first_seen_at=now - timedelta(days=5),
+        profile = _make_profile()
+        company = _make_company()
+        db_session.add_all(
+            [
+                profile,
+                company,
+                _make_vacancy(
+                    profile.id,
+                    company.id,
+                    first_seen_at=_NOW - timedelta(days=5),
+                ),
+            ]
         )
         await db_session.flush()
 
         service = ScoringService(db=db_session)
         await service.score_profile(profile.id)
 
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Lead).where(
-                Lead.company_id == company.id,
-                Lead.search_profile_id == profile.id,
-            )
-        )
-        lead = result.scalar_one()
+        lead = await _fetch_lead(db_session, company.id, profile.id)
         breakdown = lead.scoring_breakdown
 
         assert "fit" in breakdown